@@ -17,3 +17,10 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
 html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
+
+# -- Build performance -------------------------------------------------------
+# Build with ``sphinx-build -j auto`` so reading and writing use every core.
+# Only the stock MyST syntax is enabled; each extension adds parser passes.
+myst_enable_extensions = []
+# Do not import and trace re-exported members just to link their source.
+viewcode_follow_imported_members = False
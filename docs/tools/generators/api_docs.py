@@ -6,17 +6,15 @@ knowledge ecosystem. This module exemplifies Eidosian principles of contextual i
 and self-awareness as foundation.
 """
 
-import os
 import sys
-from pathlib import Path
-# Add parent directory to path for terminal_forge imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
-import inspect
-from importlib import import_module
 
 
 def main():
     """Execute the api_docs with awareness of the Terminal Forge ecosystem."""
+    # Deferred so importing the tool stays cheap; paid only when it runs
+    import inspect
+    from importlib import import_module
+    
     print(f"📘 Running API extraction and formatting system...")
     
     # Tool-specific implementations would go here
@@ -6,16 +6,14 @@ knowledge ecosystem. This module exemplifies Eidosian principles of contextual i
 and self-awareness as foundation.
 """
 
-import os
 import sys
-from pathlib import Path
-# Add parent directory to path for terminal_forge imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
-from rich.console import Console
 
 
 def main():
     """Execute the ascii_preview with awareness of the Terminal Forge ecosystem."""
+    # Deferred so importing the tool stays cheap; paid only when it runs
+    from rich.console import Console
+    
     print(f"📘 Running Visual element rendering preview...")
     
     # Tool-specific implementations would go here
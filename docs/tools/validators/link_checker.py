@@ -4,25 +4,93 @@ Documentation link integrity validator
 An intelligent documentation tool that understands its position in the Terminal Forge
 knowledge ecosystem. This module exemplifies Eidosian principles of contextual integrity
 and self-awareness as foundation.
+
+Links are checked concurrently on a single event loop through one pooled
+``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed), so handshakes are
+shared across every URL on the same host.
 """
 
-import os
 import sys
 from pathlib import Path
-# Add parent directory to path for terminal_forge imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
-import re
-import requests
-from concurrent.futures import ThreadPoolExecutor
+
+DOCS_ROOT = Path(__file__).resolve().parents[2]
+URL_PATTERN = r'https?://[^\s"\'<>()\[\]`]+'
+MAX_CONCURRENCY = 32
+TIMEOUT = 5.0
+
+
+def _compile_url_pattern():
+    """Compile URL_PATTERN with RE2 when installed, else the stdlib engine.
+    
+    RE2 matches in linear time with no backtracking, which bounds the cost
+    of pages full of near-miss URLs; its API is re-compatible.
+    """
+    try:
+        import re2 as engine
+    except ImportError:
+        import re as engine
+    return engine.compile(URL_PATTERN)
+
+
+def extract_links(paths):
+    """Map every URL found in the given files to the first file citing it."""
+    pattern = _compile_url_pattern()
+    links = {}
+    for path in paths:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        for url in pattern.findall(text):
+            links.setdefault(url.rstrip(".,;:!?*"), path)
+    return links
+
+
+async def _check(client, semaphore, url):
+    """Return (url, status code or error text) for a single link."""
+    async with semaphore:
+        try:
+            response = await client.head(url, follow_redirects=True)
+            if response.status_code in (405, 501):
+                # Some servers refuse HEAD; fall back to a full request
+                response = await client.get(url, follow_redirects=True)
+            return url, response.status_code
+        except Exception as exc:  # Any transport failure marks the link broken
+            return url, f"{type(exc).__name__}: {exc}"
+
+
+async def check_links(urls, concurrency=MAX_CONCURRENCY, timeout=TIMEOUT):
+    """Check all URLs with bounded concurrency over one keep-alive pool."""
+    import asyncio
+    import importlib.util
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    http2 = importlib.util.find_spec("h2") is not None
+    async with httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout) as client:
+        results = await asyncio.gather(*(_check(client, semaphore, url) for url in urls))
+    return dict(results)
 
 
 def main():
     """Execute the link_checker with awareness of the Terminal Forge ecosystem."""
+    # Deferred so importing the tool stays cheap; paid only when it runs
+    import asyncio
+    
     print(f"📘 Running Documentation link integrity validator...")
     
-    # Tool-specific implementations would go here
+    links = extract_links(sorted(DOCS_ROOT.rglob("*.md")))
+    results = asyncio.run(check_links(list(links)))
+    broken = {
+        url: result for url, result in results.items()
+        if not (isinstance(result, int) and result < 400)
+    }
+    
+    for url, result in sorted(broken.items()):
+        print(f"  ❌ {url} ({result}) in {links[url].relative_to(DOCS_ROOT)}")
+    print(f"✨ Checked {len(results)} links, {len(broken)} broken")
     
-    return 0
+    return 1 if broken else 0
 
 
 if __name__ == "__main__":
@@ -8,79 +8,340 @@
 
 import os
 import sys
-from pathlib import Path
+import mmap
+import multiprocessing
 from datetime import datetime
 import json
-from collections import defaultdict
+import array
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SKIP_DIRS = frozenset({"node_modules", "target", "__pycache__"})
+# Hidden, so the scan never counts its own cache
+CACHE_FILENAME = ".project_stats_cache.json"
+CHUNK_SIZE = 1 << 16
+# Below this many files the process pool costs more to start than it saves
+PARALLEL_THRESHOLD = 256
+# Threads listing directories concurrently during the walk
+SCAN_WORKERS = 16
+# Paths handed to a worker per task, amortising IPC and call overhead
+TALLY_BATCH = 64
+# Files at least this large are memory-mapped and counted in a single pass
+LARGE_FILE_THRESHOLD = 1 << 20
+_readv = getattr(os, "readv", None)
+_np = False  # Resolved lazily by _numpy()
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+def _numpy():
+    """Import NumPy on first use; None when it is not installed."""
+    global _np
+    if _np is False:
+        try:
+            import numpy as _np
+        except ImportError:
+            _np = None
+    return _np
+
+def _count_lines_mapped(fd, size):
+    """Count lines of a large file by scanning a read-only mapping of it."""
+    if size == 0:
+        return 0  # mmap rejects empty files
+    np = _numpy()
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        if np is not None:
+            # Vectorised compare + reduction per window, so the temporary mask
+            # stays window-sized; the view is released before close
+            view = np.frombuffer(mm, dtype=np.uint8)
+            lines = sum(
+                int(np.count_nonzero(view[i:i + LARGE_FILE_THRESHOLD] == 0x0A))
+                for i in range(0, size, LARGE_FILE_THRESHOLD)
+            )
+            del view
+        else:
+            # mmap has no count(), so scan it window by window
+            lines = sum(
+                mm[i:i + LARGE_FILE_THRESHOLD].count(b"\n")
+                for i in range(0, len(mm), LARGE_FILE_THRESHOLD)
+            )
+        last = mm[-1:]
+    return lines + (last != b"\n")
+
+def _count_lines_fd(fd, _buf=bytearray(CHUNK_SIZE)):
+    """Count lines readable from an open file descriptor."""
+    lines = 0
+    last = b"\n"
+    if _readv is None:
+        # No readv (Windows): fall back to allocating reads
+        chunk = os.read(fd, CHUNK_SIZE)
+        if len(chunk) == CHUNK_SIZE:
+            size = os.fstat(fd).st_size
+            if size >= LARGE_FILE_THRESHOLD:
+                return _count_lines_mapped(fd, size)
+        while chunk:
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+            chunk = os.read(fd, CHUNK_SIZE)
+    else:
+        bufs = [_buf]
+        n = _readv(fd, bufs)
+        # Only files that fill the first read pay for an fstat
+        if n == CHUNK_SIZE:
+            size = os.fstat(fd).st_size
+            if size >= LARGE_FILE_THRESHOLD:
+                return _count_lines_mapped(fd, size)
+        while n:
+            lines += _buf.count(b"\n", 0, n)
+            last = _buf[n - 1:n]
+            n = _readv(fd, bufs)
+    # A trailing line without a newline still counts, as with readlines()
+    return lines + (last != b"\n")
 
 def count_lines_by_extension(file_path):
     """Count lines in a file."""
+    # Raw descriptors skip the fstat and object setup FileIO does per open
+    try:
+        fd = os.open(file_path, _OPEN_FLAGS)
+    except OSError:
+        return 0
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return len(f.readlines())
+        return _count_lines_fd(fd)
     except Exception:
         return 0
+    finally:
+        os.close(fd)
+
+def _tally(paths):
+    """Return the line count of each path; workers run one call per batch."""
+    count = count_lines_by_extension
+    return [count(path) for path in paths]
 
-def get_file_stats(repo_path):
-    """Get statistics about files in the repository."""
-    # Escaped literal dictionary inside lambda
-    stats = defaultdict(lambda: {"count": 0, "lines": 0})
-    total_files = 0
-    total_lines = 0
+def _scan_dir(path):
+    """List one directory: visible files plus subdirectories to descend into."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                # Skip hidden files and directories (names are never empty)
+                if name[0] == '.':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append(entry)
+    except OSError:
+        pass
+    return files, subdirs
+
+def _scan(repo_path, workers=SCAN_WORKERS):
+    """Yield a DirEntry for every visible file, skipping ignored directories.
     
-    for root, _, files in os.walk(repo_path):
-        # Skip hidden directories and node_modules
-        if "/." in root or "node_modules" in root or "target" in root or "__pycache__" in root:
-            continue
-            
-        for file in files:
-            # Skip hidden files
-            if file.startswith('.'):
+    Each directory is listed on a thread pool; scandir releases the GIL while
+    reading entries, so directory latency (notably on network filesystems)
+    overlaps instead of accumulating. os.fwalk is deliberately not used: it
+    serialises the walk, adds an fstat per directory, and its dir_fd-relative
+    opens cannot be handed to the counting processes.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = {ex.submit(_scan_dir, repo_path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                yield from files
+                pending.update(ex.submit(_scan_dir, subdir) for subdir in subdirs)
+
+def _pool_context():
+    """Start method for the counting pool.
+    
+    The pool starts while the scandir threads are still running, and forking a
+    multi-threaded process can deadlock the child, so workers come from a
+    forkserver (or are spawned where forkserver is unavailable).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def _load_cache(cache_path):
+    """Load the path -> [mtime_ns, size, lines] cache from a previous run."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _write_if_changed(path, data):
+    """Atomically write bytes to path, leaving it untouched if identical."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # A read-only tree simply runs without a warm cache
+
+def get_file_stats(repo_path, cache_path=None):
+    """Get statistics about files in the repository.
+    
+    Line counts are cached in cache_path (default: CACHE_FILENAME in the
+    repository root) and reused for files whose mtime and size are unchanged.
+    """
+    repo_path = os.fspath(repo_path)
+    if cache_path is None:
+        cache_path = os.path.join(repo_path, CACHE_FILENAME)
+    cache = _load_cache(cache_path)
+    fresh_cache = {}
+    
+    counted = []
+    exts = []
+    paths = []
+    keys = []
+    intern = sys.intern
+    cache_get = cache.get
+    # Counting overlaps the walk: once the tree is known to be large enough
+    # for a pool, each full batch of uncached paths is dispatched right away
+    pool = None
+    futures = []
+    submitted = 0
+    try:
+        for entry in _scan(repo_path):
+            # Hidden names never reach here, so the last dot is the split point;
+            # interned keys let the ext_idx lookups compare by identity
+            _, sep, tail = entry.name.rpartition('.')
+            ext = intern(tail.lower()) if sep and tail else 'no_extension'
+            file_path = entry.path
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                counted.append((ext, count_lines_by_extension(file_path)))
+                continue
+            key = [st.st_mtime_ns, st.st_size]
+            cached = cache_get(file_path)
+            if cached is not None and cached[:2] == key:
+                fresh_cache[file_path] = cached
+                counted.append((ext, cached[2]))
                 continue
-                
-            file_path = os.path.join(root, file)
-            _, ext = os.path.splitext(file)
-            ext = ext.lstrip('.').lower() or 'no_extension'
-            
-            lines = count_lines_by_extension(file_path)
-            
-            stats[ext]["count"] += 1
-            stats[ext]["lines"] += lines
-            total_files += 1
-            total_lines += lines
+            exts.append(ext)
+            paths.append(file_path)
+            keys.append(key)
+            if pool is None and len(paths) >= PARALLEL_THRESHOLD:
+                pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_pool_context())
+            if pool is not None:
+                while len(paths) - submitted >= TALLY_BATCH:
+                    batch = paths[submitted:submitted + TALLY_BATCH]
+                    futures.append(pool.submit(_tally, batch))
+                    submitted += TALLY_BATCH
+        
+        if pool is None:
+            line_counts = _tally(paths)
+        else:
+            if submitted < len(paths):
+                futures.append(pool.submit(_tally, paths[submitted:]))
+            line_counts = [lines for future in futures for lines in future.result()]
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    
+    for file_path, key, lines in zip(paths, keys, line_counts):
+        key.append(lines)
+        fresh_cache[file_path] = key
+    counted.extend(zip(exts, line_counts))
+    
+    # Per-extension columns indexed by ext_idx; dicts are built only for output
+    ext_idx = {}
+    counts = array.array('q')
+    line_totals = array.array('q')
+    for ext, lines in counted:
+        idx = ext_idx.get(ext)
+        if idx is None:
+            idx = ext_idx[ext] = len(counts)
+            counts.append(0)
+            line_totals.append(0)
+        counts[idx] += 1
+        line_totals[idx] += lines
+    
+    if orjson is not None:
+        cache_data = orjson.dumps(fresh_cache, option=orjson.OPT_SORT_KEYS)
+    else:
+        cache_data = json.dumps(fresh_cache, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    _write_if_changed(cache_path, cache_data)
     
     # Escaped literal dictionary for return
     return {
-        "by_extension": dict(stats),
-        "total_files": total_files,
-        "total_lines": total_lines,
+        "by_extension": {
+            ext: {"count": counts[idx], "lines": line_totals[idx]}
+            for ext, idx in ext_idx.items()
+        },
+        "total_files": sum(counts),
+        "total_lines": sum(line_totals),
         "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
+def _encode_json(obj):
+    """Encode one JSON value to bytes with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _stream_write_stats(stats, f):
+    """Write stats as JSON one entry at a time instead of one large string.
+    
+    Each extension is encoded and written on its own line, so memory use
+    stays bounded however many extensions the repository has.
+    """
+    f.write(b'{\n  "by_extension": {')
+    sep = b'\n    '
+    for ext, data in stats["by_extension"].items():
+        f.write(sep)
+        f.write(_encode_json(ext))
+        f.write(b': ')
+        f.write(_encode_json(data))
+        sep = b',\n    '
+    f.write(b'\n  }')
+    for key, value in stats.items():
+        if key == "by_extension":
+            continue
+        f.write(b',\n  ')
+        f.write(_encode_json(key))
+        f.write(b': ')
+        f.write(_encode_json(value))
+    f.write(b'\n}\n')
+
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
-        repo_path = sys.argv[1]
+    args = sys.argv[1:]
+    verbose = "--verbose" in args
+    args = [arg for arg in args if arg != "--verbose"]
+    if args:
+        repo_path = args[0]
     else:
         # Default to the repository root
-        script_dir = Path(__file__).parent.absolute()
-        repo_path = script_dir.parent.parent
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        repo_path = os.path.dirname(os.path.dirname(script_dir))
     
     # The following f-strings are meant to be preserved in the generated file,
     # so we escape their curly braces.
     print(f"🔮 Eidosian Project Stats Generator")
     print(f"==================================")
-    print(f"Analyzing repository: {repo_path}")
+    print(f"Analyzing repository: {repo_path}", flush=True)
     
     stats = get_file_stats(repo_path)
     
-    # Print summary
-    print(f"\nRepository Summary:")
-    print(f"-------------------")
-    print(f"Total files: {stats['total_files']}")
-    print(f"Total lines: {stats['total_lines']:,}")
-    print("\nFiles by extension:")
-    
     # Sort extensions by line count
     sorted_extensions = sorted(
         stats["by_extension"].items(),
@@ -88,16 +349,30 @@ def main():
         reverse=True
     )
     
-    for ext, data in sorted_extensions:
-        print(f"  .{ext:<10} {data['count']:5} files, {data['lines']:8,} lines")
+    # Build the summary once and emit it with a single write
+    out = [
+        "",
+        "Repository Summary:",
+        "-------------------",
+        f"Total files: {stats['total_files']}",
+        f"Total lines: {stats['total_lines']:,}",
+        "",
+        "Files by extension:",
+    ]
+    out.extend(
+        f"  .{ext:<10} {data['count']:5} files, {data['lines']:8,} lines"
+        for ext, data in sorted_extensions
+    )
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Save to JSON
     output_path = os.path.join(repo_path, "project_stats.json")
-    with open(output_path, 'w') as f:
-        json.dump(stats, f, indent=2)
+    with open(output_path, 'wb') as f:
+        _stream_write_stats(stats, f)
     
     print(f"\n✨ Stats saved to {output_path}")
-    print(f"Script stats: {stats}")  # Clean, direct logging without complex formatters
+    if verbose:
+        print(f"Script stats: {stats}")  # Clean, direct logging without complex formatters
 
 if __name__ == "__main__":
     main()
@@ -18,16 +18,44 @@ Eidosian design principles:
 """
 
 import os
+import sys
+import logging
+import signal
+import hashlib
 from typing import Literal, Optional, Tuple, Union, Dict, List, Any, Callable, TypeVar, Protocol
 from pathlib import Path
 import math
 from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from itertools import repeat
 
 try:
-    from PIL import Image, ImageOps, ImageEnhance
+    import PIL
+    from PIL import Image, ImageOps, ImageEnhance, ImageFilter, ImageChops, ImageStat
     HAS_PIL = True
+    # Pillow-SIMD releases carry a ".postN" suffix on the upstream version
+    HAS_PIL_SIMD = '.post' in PIL.__version__
 except ImportError:
     HAS_PIL = False
+    HAS_PIL_SIMD = False
+
+PIL_BACKEND = ('pillow-simd' if HAS_PIL_SIMD else 'pillow') if HAS_PIL else None
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+logger = logging.getLogger(__name__)
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🧬 Types & Protocols - Structural DNA               │
@@ -85,13 +113,136 @@ SPECIALIZED_SETS = {
 # Combined set for convenient access
 ALL_CHAR_SETS = {**CHAR_SETS, **PERCEPTUAL_SETS, **SPECIALIZED_SETS}
 
+
+def _build_char_lut(chars: str) -> str:
+    """Expand a character ramp into a 256-character grayscale lookup string.
+    
+    Position ``v`` holds the character the renderer picks for gray level ``v``,
+    so ``lut[v]`` maps a pixel directly and the string also works unchanged as
+    a ``str.translate`` table over latin-1 decoded pixel bytes.
+    
+    Args:
+        chars: Character ramp from darkest to brightest
+        
+    Returns:
+        String of exactly 256 characters
+    """
+    last = len(chars) - 1
+    return ''.join(chars[int((v / 255) * last)] for v in range(256))
+
+
+# Per-set grayscale lookup strings, built once at import
+CHAR_LUTS = {name: _build_char_lut(chars) for name, chars in ALL_CHAR_SETS.items()}
+
+# Perceptual ramps are hand-ordered by visual density, so they tabulate directly
+PERCEPTUAL_LUTS = {name: _build_char_lut(chars) for name, chars in PERCEPTUAL_SETS.items()}
+
+
+def map_gray_to_chars(gray: Union['np.ndarray', 'Image.Image'], lut: str) -> List[str]:
+    """Map grayscale pixels to text rows through a 256-character lookup string.
+    
+    The whole buffer goes through a single ``str.translate`` call, so the cost
+    per pixel is one table read in C.
+    
+    Args:
+        gray: 2D uint8 array or PIL Image in mode 'L'
+        lut: Lookup string such as an entry of ``CHAR_LUTS`` or ``PERCEPTUAL_LUTS``
+        
+    Returns:
+        List of strings, one per pixel row
+    """
+    if hasattr(gray, 'shape'):
+        height, width = gray.shape
+        data = np.ascontiguousarray(gray, dtype=np.uint8).tobytes()
+    else:
+        width, height = gray.size
+        data = gray.tobytes()
+    
+    text = data.decode('latin-1').translate(lut)
+    return [text[y * width:(y + 1) * width] for y in range(height)]
+
 # ╭──────────────────────────────────────────────────────╮
 # │  🧮 Dithering Algorithms - Error Diffusion Mastery   │
 # ╰──────────────────────────────────────────────────────╯
 
 from typing import Type, Protocol, runtime_checkable
-import array
 
+if HAS_NUMBA:
+    # Native versions of the scalar loops below; the serial pixel dependency of
+    # error diffusion is exactly what NumPy can't vectorize but a JIT handles well
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _fs_kernel(buf, height, width):
+        # Serpentine scan: odd rows run right to left. Error rows are kept in scan
+        # order with one pad slot per side, so the kernel is the same in both
+        # directions and edge terms land in the padding instead of being tested.
+        # `below` gathers the 3/16, 5/16 and 1/16 terms and, reversed, becomes the
+        # next row's `cur`; the 7/16 term never leaves a register.
+        cur = np.zeros(width + 2, np.int32)
+        below = np.zeros(width + 2, np.int32)
+        for y in range(height):
+            below[:] = 0
+            carry = 0
+            for i in range(width):
+                x = width - 1 - i if y & 1 else i
+                old_pixel = buf[y, x] + cur[i + 1] + carry
+                new_pixel = 255 if old_pixel >= 128 else 0
+                buf[y, x] = new_pixel
+                error = old_pixel - new_pixel
+                carry = (error * 7) // 16
+                below[i] += (error * 3) // 16
+                below[i + 1] += (error * 5) // 16
+                below[i + 2] += error // 16
+            cur[:] = below[::-1]
+    
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _diffuse_kernel(buf, height, width, offsets, denom):
+        for y in range(height):
+            for x in range(width):
+                old_pixel = buf[y, x]
+                new_pixel = 255 if old_pixel >= 128 else 0
+                buf[y, x] = new_pixel
+                error = old_pixel - new_pixel
+                
+                for i in range(offsets.shape[0]):
+                    ny = y + offsets[i, 0]
+                    nx = x + offsets[i, 1]
+                    if ny < height and 0 <= nx < width:
+                        buf[ny, nx] += error * offsets[i, 2] // denom
+    
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _color_fs_kernel(buf, height, width, cube, palette, steps):
+        # Color Floyd-Steinberg over an (H, W, 3) int16 buffer. Errors are carried in
+        # sixteenths in two resident rows and divided once per pixel on read. Colors map
+        # through the 32x32x32 index cube into `palette` or, when `cube` is empty, snap
+        # per channel through the 256-entry `steps` table.
+        cur = np.zeros((width + 2, 3), np.int32)
+        below = np.zeros((width + 2, 3), np.int32)
+        for y in range(height):
+            below[:] = 0
+            for x in range(width):
+                r = buf[y, x, 0] + (cur[x + 1, 0] >> 4)
+                g = buf[y, x, 1] + (cur[x + 1, 1] >> 4)
+                b = buf[y, x, 2] + (cur[x + 1, 2] >> 4)
+                r = 255 if r > 255 else (0 if r < 0 else r)
+                g = 255 if g > 255 else (0 if g < 0 else g)
+                b = 255 if b > 255 else (0 if b < 0 else b)
+                if cube.shape[0]:
+                    index = cube[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+                    r_new, g_new, b_new = palette[index, 0], palette[index, 1], palette[index, 2]
+                else:
+                    r_new, g_new, b_new = steps[r], steps[g], steps[b]
+                buf[y, x, 0] = r_new
+                buf[y, x, 1] = g_new
+                buf[y, x, 2] = b_new
+                
+                # Padded rows: x + 1 is this pixel, x and x + 2 its neighbours
+                for c, error in ((0, r - r_new), (1, g - g_new), (2, b - b_new)):
+                    cur[x + 2, c] += error * 7
+                    below[x, c] += error * 3
+                    below[x + 1, c] += error * 5
+                    below[x + 2, c] += error
+            cur, below = below, cur
+    
 @runtime_checkable
 class DitheringAlgorithm(Protocol):
     """Protocol defining dithering algorithm interface with guaranteed behavior."""
@@ -120,6 +271,9 @@ class FloydSteinberg:
                      *  7/16
             3/16  5/16  1/16
     
+    Rows are scanned serpentine (boustrophedon): odd rows run right to left with
+    the pattern mirrored, which avoids the diagonal drift of one-way scans.
+    
     Known for good quality and moderate computational efficiency.
     """
     
@@ -133,13 +287,20 @@ class FloydSteinberg:
         img = image.convert('L')
         width, height = img.size
         
-        # Create array for faster manipulation
-        pixels = array.array('B', img.tobytes())
+        if HAS_NUMPY:
+            return Image.fromarray(FloydSteinberg.apply_array(np.asarray(img)))
+        
+        # Signed working copy: accumulated error may leave 0-255 until thresholded
+        pixels = list(img.tobytes())
         threshold = 128  # Mid-gray threshold for binary decision
         
         for y in range(height):
-            for x in range(width):
-                idx = y * width + x
+            # Serpentine scan: odd rows run right to left with the pattern mirrored
+            step = -1 if y & 1 else 1
+            start = y * width + (width - 1 if step < 0 else 0)
+            
+            for i in range(width):
+                idx = start + i * step
                 old_pixel = pixels[idx]
                 new_pixel = 255 if old_pixel >= threshold else 0
                 pixels[idx] = new_pixel
@@ -148,26 +309,207 @@ class FloydSteinberg:
                 error = old_pixel - new_pixel
                 
                 # Distribute error to neighboring pixels according to F-S pattern
-                if x < width - 1:
-                    # Right pixel (7/16)
-                    pixels[idx + 1] = min(255, max(0, pixels[idx + 1] + (error * 7) // 16))
+                if i < width - 1:
+                    # Next pixel in scan order (7/16)
+                    pixels[idx + step] += (error * 7) // 16
                 
                 if y < height - 1:
                     next_row = idx + width
                     
-                    if x > 0:
-                        # Bottom-left pixel (3/16)
-                        pixels[next_row - 1] = min(255, max(0, pixels[next_row - 1] + (error * 3) // 16))
+                    if i > 0:
+                        # Below, behind the scan (3/16)
+                        pixels[next_row - step] += (error * 3) // 16
                     
                     # Bottom pixel (5/16)
-                    pixels[next_row] = min(255, max(0, pixels[next_row] + (error * 5) // 16))
+                    pixels[next_row] += (error * 5) // 16
                     
-                    if x < width - 1:
-                        # Bottom-right pixel (1/16)
-                        pixels[next_row + 1] = min(255, max(0, pixels[next_row + 1] + (error * 1) // 16))
+                    if i < width - 1:
+                        # Below, ahead of the scan (1/16)
+                        pixels[next_row + step] += (error * 1) // 16
+        
+        # Every pixel is now exactly 0 or 255
+        return Image.frombytes('L', (width, height), bytes(pixels))
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Apply Floyd-Steinberg dithering to a 2D uint8 grayscale array.
         
-        # Create new image from the processed pixels
-        return Image.frombytes('L', (width, height), pixels.tobytes())
+        Args:
+            gray: Grayscale pixels of shape (height, width)
+            
+        Returns:
+            New uint8 array of the same shape holding only 0 and 255
+        """
+        height, width = gray.shape
+        buf = gray.astype(np.int16)
+        if HAS_NUMBA:
+            _fs_kernel(buf, height, width)
+        else:
+            FloydSteinberg._diffuse_rows(buf)
+        return buf.astype(np.uint8)
+    
+    @staticmethod
+    def _diffuse_rows(arr: 'np.ndarray') -> None:
+        """Row-vectorized serpentine Floyd-Steinberg producing the same bits as the scalar loop.
+        
+        Only the 7/16 term feeds the row being scanned, so it stays in a scalar
+        loop; the three next-row terms are applied as whole-row slice additions
+        once the row's errors are known, mirrored on right-to-left rows. Works in
+        place on an int16 buffer.
+        """
+        height, width = arr.shape
+        
+        for y in range(height):
+            row = arr[y].tolist()
+            errors = [0] * width
+            step = -1 if y & 1 else 1
+            
+            for x in (range(width - 1, -1, -1) if step < 0 else range(width)):
+                old_pixel = row[x]
+                new_pixel = 255 if old_pixel >= 128 else 0
+                row[x] = new_pixel
+                error = old_pixel - new_pixel
+                errors[x] = error
+                
+                if 0 <= x + step < width:
+                    row[x + step] += (error * 7) // 16
+            
+            arr[y] = row
+            if y == height - 1:
+                break
+            
+            err = np.array(errors, np.int16)
+            below = arr[y + 1]
+            below += (err * 5) // 16
+            if step > 0:
+                # Bottom-right (1/16) from x-1, bottom-left (3/16) from x+1
+                below[1:] += err[:-1] // 16
+                below[:-1] += (err[1:] * 3) // 16
+            else:
+                # Mirrored: bottom-left (1/16) from x+1, bottom-right (3/16) from x-1
+                below[:-1] += err[1:] // 16
+                below[1:] += (err[:-1] * 3) // 16
+
+
+# Error diffusion tables as (dy, dx, weight) triples over a shared denominator
+ATKINSON_OFFSETS = ((0, 1, 1), (0, 2, 1), (1, -1, 1), (1, 0, 1), (1, 1, 1), (2, 0, 1))
+JJN_OFFSETS = (
+    (0, 1, 7), (0, 2, 5),
+    (1, -2, 3), (1, -1, 5), (1, 0, 7), (1, 1, 5), (1, 2, 3),
+    (2, -2, 1), (2, -1, 3), (2, 0, 5), (2, 1, 3), (2, 2, 1),
+)
+SIERRA_OFFSETS = (
+    (0, 1, 5), (0, 2, 3),
+    (1, -2, 2), (1, -1, 4), (1, 0, 5), (1, 1, 4), (1, 2, 2),
+    (2, -1, 2), (2, 0, 3), (2, 1, 2),
+)
+STUCKI_OFFSETS = (
+    (0, 1, 8), (0, 2, 4),
+    (1, -2, 2), (1, -1, 4), (1, 0, 8), (1, 1, 4), (1, 2, 2),
+    (2, -2, 1), (2, -1, 2), (2, 0, 4), (2, 1, 2), (2, 2, 1),
+)
+
+
+def _diffuse(
+    image: 'Image.Image',
+    offsets: Tuple[Tuple[int, int, int], ...],
+    denom: int,
+) -> 'Image.Image':
+    """Apply threshold error diffusion described by a coefficient table.
+    
+    Every pixel is thresholded at 128 and ``error * weight // denom`` is added to
+    each in-bounds neighbour at ``(y + dy, x + dx)``. Accumulated values are left
+    unclamped; thresholding maps every pixel to 0 or 255 regardless.
+    
+    Args:
+        image: PIL Image to dither
+        offsets: (dy, dx, weight) triples, dy >= 0
+        denom: Shared denominator for all weights
+        
+    Returns:
+        Dithered PIL Image in mode 'L'
+    """
+    img = image.convert('L')
+    width, height = img.size
+    
+    if HAS_NUMPY:
+        return Image.fromarray(_diffuse_array(np.asarray(img), offsets, denom))
+    
+    # Flat index step of each term, resolved once per image instead of per pixel
+    terms = tuple((dy * width + dx, dy, dx, weight) for dy, dx, weight in offsets)
+    
+    pixels = list(img.tobytes())
+    idx = 0
+    for y in range(height):
+        rows_left = height - y
+        for x in range(width):
+            old_pixel = pixels[idx]
+            new_pixel = 255 if old_pixel >= 128 else 0
+            pixels[idx] = new_pixel
+            error = old_pixel - new_pixel
+            
+            if error:
+                for step, dy, dx, weight in terms:
+                    if dy < rows_left and 0 <= x + dx < width:
+                        pixels[idx + step] += error * weight // denom
+            idx += 1
+    
+    return Image.frombytes('L', (width, height), bytes(pixels))
+
+
+def _diffuse_array(
+    gray: 'np.ndarray',
+    offsets: Tuple[Tuple[int, int, int], ...],
+    denom: int,
+) -> 'np.ndarray':
+    """Array core of :func:`_diffuse`, taking and returning 2D uint8 grayscale.
+    
+    With Numba the whole loop runs natively. With NumPy alone, only same-row terms run
+    in the scalar loop; terms for later rows are applied as one slice addition per
+    offset once the row's errors are known.
+    """
+    height, width = gray.shape
+    arr = gray.astype(np.int32)
+    
+    if HAS_NUMBA:
+        _diffuse_kernel(arr, height, width, np.array(offsets, np.int64), denom)
+        return arr.astype(np.uint8)
+    
+    row_terms = [(dx, weight) for dy, dx, weight in offsets if dy == 0]
+    below_terms = [(dy, dx, weight) for dy, dx, weight in offsets if dy > 0 and abs(dx) < width]
+    
+    for y in range(height):
+        row = arr[y].tolist()
+        errors = [0] * width
+        
+        for x in range(width):
+            old_pixel = row[x]
+            new_pixel = 255 if old_pixel >= 128 else 0
+            row[x] = new_pixel
+            error = old_pixel - new_pixel
+            errors[x] = error
+            
+            for dx, weight in row_terms:
+                nx = x + dx
+                if nx < width:
+                    row[nx] += error * weight // denom
+        
+        arr[y] = row
+        err = np.array(errors, np.int32)
+        
+        for dy, dx, weight in below_terms:
+            if y + dy >= height:
+                continue
+            target = arr[y + dy]
+            contribution = err * weight // denom
+            if dx > 0:
+                target[dx:] += contribution[:width - dx]
+            elif dx < 0:
+                target[:dx] += contribution[-dx:]
+            else:
+                target += contribution
+    
+    return arr.astype(np.uint8)
 
 
 class Atkinson:
@@ -188,46 +530,12 @@ class Atkinson:
     @staticmethod
     def apply(image: 'Image.Image') -> 'Image.Image':
         """Apply Atkinson dithering with optimized error diffusion."""
-        img = image.convert('L')
-        width, height = img.size
-        
-        # Create working copy as array for faster manipulation
-        pixels = array.array('B', img.tobytes())
-        threshold = 128  # Mid-gray threshold
-        
-        # Process pixels efficiently in a single pass
-        for y in range(height):
-            for x in range(width):
-                idx = y * width + x
-                old_pixel = pixels[idx]
-                new_pixel = 255 if old_pixel >= threshold else 0
-                pixels[idx] = new_pixel
-                
-                # Calculate error (Atkinson only distributes 3/4 of the error)
-                error = (old_pixel - new_pixel) >> 3  # Divide by 8 efficiently
-                
-                # Atkinson pattern - 1/8 to each of 6 pixels
-                # Right and far right
-                if x + 1 < width:
-                    pixels[idx + 1] = min(255, max(0, pixels[idx + 1] + error))
-                if x + 2 < width:
-                    pixels[idx + 2] = min(255, max(0, pixels[idx + 2] + error))
-                
-                # Next row: left, center, right
-                if y + 1 < height:
-                    row_offset = idx + width
-                    if x > 0:
-                        pixels[row_offset - 1] = min(255, max(0, pixels[row_offset - 1] + error))
-                    pixels[row_offset] = min(255, max(0, pixels[row_offset] + error))
-                    if x + 1 < width:
-                        pixels[row_offset + 1] = min(255, max(0, pixels[row_offset + 1] + error))
-                
-                # Two rows down, center
-                if y + 2 < height:
-                    pixels[idx + 2 * width] = min(255, max(0, pixels[idx + 2 * width] + error))
-        
-        # Create new image with dithered array
-        return Image.frombytes('L', (width, height), pixels.tobytes())
+        return _diffuse(image, ATKINSON_OFFSETS, 8)
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Dither a 2D uint8 grayscale array, returning a new 0/255 array."""
+        return _diffuse_array(gray, ATKINSON_OFFSETS, 8)
 
 
 class JarvisJudiceNinke:
@@ -249,49 +557,12 @@ class JarvisJudiceNinke:
     @staticmethod
     def apply(image: 'Image.Image') -> 'Image.Image':
         """Apply JJN dithering with precise error diffusion matrix."""
-        img = image.convert('L')
-        width, height = img.size
-        
-        # Create working copy as array for faster manipulation
-        pixels = array.array('B', img.tobytes())
-        threshold = 128
-        
-        # Process pixels with full JJN pattern
-        for y in range(height):
-            for x in range(width):
-                idx = y * width + x
-                old_pixel = pixels[idx]
-                new_pixel = 255 if old_pixel >= threshold else 0
-                pixels[idx] = new_pixel
-                
-                # Calculate error
-                error = old_pixel - new_pixel
-                
-                # Current row (forward only)
-                if x + 1 < width:
-                    pixels[idx + 1] = min(255, max(0, pixels[idx + 1] + error * 7 // 48))
-                if x + 2 < width:
-                    pixels[idx + 2] = min(255, max(0, pixels[idx + 2] + error * 5 // 48))
-                
-                # Next row - five positions
-                if y + 1 < height:
-                    next_row_idx = idx + width
-                    for dx, weight in [(-2, 3), (-1, 5), (0, 7), (1, 5), (2, 3)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 48))
-                
-                # Two rows down - five positions
-                if y + 2 < height:
-                    next_row_idx = idx + width * 2
-                    for dx, weight in [(-2, 1), (-1, 3), (0, 5), (1, 3), (2, 1)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 48))
-        
-        return Image.frombytes('L', (width, height), pixels.tobytes())
+        return _diffuse(image, JJN_OFFSETS, 48)
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Dither a 2D uint8 grayscale array, returning a new 0/255 array."""
+        return _diffuse_array(gray, JJN_OFFSETS, 48)
 
 
 class Sierra:
@@ -313,46 +584,12 @@ class Sierra:
     @staticmethod
     def apply(image: 'Image.Image') -> 'Image.Image':
         """Apply Sierra dithering with optimized implementation."""
-        img = image.convert('L')
-        width, height = img.size
-        
-        pixels = array.array('B', img.tobytes())
-        threshold = 128
-        
-        for y in range(height):
-            for x in range(width):
-                idx = y * width + x
-                old_pixel = pixels[idx]
-                new_pixel = 255 if old_pixel >= threshold else 0
-                pixels[idx] = new_pixel
-                
-                error = old_pixel - new_pixel
-                
-                # Current row - forward only
-                if x + 1 < width:
-                    pixels[idx + 1] = min(255, max(0, pixels[idx + 1] + error * 5 // 32))
-                if x + 2 < width:
-                    pixels[idx + 2] = min(255, max(0, pixels[idx + 2] + error * 3 // 32))
-                
-                # Next row - five positions
-                if y + 1 < height:
-                    next_row_idx = idx + width
-                    for dx, weight in [(-2, 2), (-1, 4), (0, 5), (1, 4), (2, 2)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 32))
-                
-                # Two rows down - three positions
-                if y + 2 < height:
-                    next_row_idx = idx + width * 2
-                    for dx, weight in [(-1, 2), (0, 3), (1, 2)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 32))
-        
-        return Image.frombytes('L', (width, height), pixels.tobytes())
+        return _diffuse(image, SIERRA_OFFSETS, 32)
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Dither a 2D uint8 grayscale array, returning a new 0/255 array."""
+        return _diffuse_array(gray, SIERRA_OFFSETS, 32)
 
 
 class StuckiDithering:
@@ -374,46 +611,16 @@ class StuckiDithering:
     @staticmethod
     def apply(image: 'Image.Image') -> 'Image.Image':
         """Apply Stucki dithering algorithm with optimized implementation."""
-        img = image.convert('L')
-        width, height = img.size
-        
-        pixels = array.array('B', img.tobytes())
-        threshold = 128
-        
-        for y in range(height):
-            for x in range(width):
-                idx = y * width + x
-                old_pixel = pixels[idx]
-                new_pixel = 255 if old_pixel >= threshold else 0
-                pixels[idx] = new_pixel
-                
-                error = old_pixel - new_pixel
-                
-                # Current row - forward only
-                if x + 1 < width:
-                    pixels[idx + 1] = min(255, max(0, pixels[idx + 1] + error * 8 // 42))
-                if x + 2 < width:
-                    pixels[idx + 2] = min(255, max(0, pixels[idx + 2] + error * 4 // 42))
-                
-                # Next row - five positions
-                if y + 1 < height:
-                    next_row_idx = idx + width
-                    for dx, weight in [(-2, 2), (-1, 4), (0, 8), (1, 4), (2, 2)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 42))
-                
-                # Two rows down - five positions
-                if y + 2 < height:
-                    next_row_idx = idx + width * 2
-                    for dx, weight in [(-2, 1), (-1, 2), (0, 4), (1, 2), (2, 1)]:
-                        nx = x + dx
-                        if 0 <= nx < width:
-                            pixels[next_row_idx + dx] = min(255, max(0, 
-                                pixels[next_row_idx + dx] + error * weight // 42))
-        
-        return Image.frombytes('L', (width, height), pixels.tobytes())
+        return _diffuse(image, STUCKI_OFFSETS, 42)
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Dither a 2D uint8 grayscale array, returning a new 0/255 array."""
+        return _diffuse_array(gray, STUCKI_OFFSETS, 42)
+
+
+# Mid-gray threshold as a ready-made table so Pillow maps it in C
+_THRESHOLD_LUT = bytes(255 if v >= 128 else 0 for v in range(256))
 
 
 class NoDither:
@@ -430,7 +637,23 @@ class NoDither:
     @staticmethod
     def apply(image: 'Image.Image') -> 'Image.Image':
         """Apply simple thresholding without dithering."""
-        return image.convert('L').point(lambda x: 255 if x >= 128 else 0, '1')
+        return image.convert('L').point(_THRESHOLD_LUT, '1')
+    
+    @staticmethod
+    def apply_array(gray: 'np.ndarray') -> 'np.ndarray':
+        """Threshold a 2D uint8 grayscale array, returning a new 0/255 array."""
+        return np.where(gray >= 128, 255, 0).astype(np.uint8)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _worker_pool() -> ThreadPoolExecutor:
+    """Get the module's shared worker pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="terminal_forge")
+    return _executor
 
 
 class DitheringRegistry:
@@ -486,13 +709,86 @@ class DitheringRegistry:
         """
         return {name: algo.description for name, algo in cls._algorithms.items()}
 
+    @classmethod
+    def apply_batch(cls, name: str, images: List['Image.Image']) -> List['Image.Image']:
+        """Dither independent images concurrently, such as the frames of an animation.
+        
+        Error diffusion is sequential within an image but images don't depend on
+        each other, so each one runs on a worker thread. This scales with cores
+        only where the work releases the GIL, i.e. the Numba kernels and Pillow's
+        own conversions; the Python-level fallbacks gain nothing over a plain loop.
+        
+        Args:
+            name: Algorithm identifier
+            images: PIL Images to dither
+        
+        Returns:
+            Dithered PIL Images in input order
+        
+        Raises:
+            ValueError: If algorithm name is not recognized
+        """
+        algorithm = cls.get(name)
+        if len(images) < 2:
+            return [algorithm.apply(image) for image in images]
+        
+        return list(_worker_pool().map(algorithm.apply, images))
+
 # Replace the old DITHERING_ALGORITHMS dict with the registry
 DITHERING_ALGORITHMS = DitheringRegistry._algorithms
 
+
+def dither_array(name: str, gray: 'np.ndarray') -> 'np.ndarray':
+    """Dither a grayscale array without a round trip through PIL.
+    
+    Uses the algorithm's ``apply_array`` when it provides one; algorithms
+    registered with only ``apply`` are run through an intermediate image.
+    
+    Args:
+        name: Registered algorithm identifier
+        gray: 2D uint8 array of grayscale pixels
+        
+    Returns:
+        2D uint8 array of the same shape holding only 0 and 255
+        
+    Raises:
+        ValueError: If algorithm name is not recognized
+        ImportError: If NumPy is not installed
+    """
+    if not HAS_NUMPY:
+        raise ImportError("Array dithering requires NumPy. Install with 'pip install numpy'")
+    
+    algorithm = DitheringRegistry.get(name)
+    if hasattr(algorithm, 'apply_array'):
+        return algorithm.apply_array(np.asarray(gray, dtype=np.uint8))
+    return np.asarray(algorithm.apply(Image.fromarray(np.asarray(gray, dtype=np.uint8))).convert('L'))
+
 # ╭──────────────────────────────────────────────────────╮
 # │  🌈 Color Mapping - Perceptual Intelligence System   │
 # ╰──────────────────────────────────────────────────────╯
 
+def _srgb_to_linear(v: float) -> float:
+    """Gamma-expand one sRGB channel value (0-255) to linear light."""
+    v = v / 255.0
+    return (v / 12.92) if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+# sRGB gamma expansion has only 256 possible integer inputs per channel, so it is tabulated
+_SRGB_TO_LINEAR = tuple(_srgb_to_linear(v) for v in range(256))
+
+# Linear RGB to XYZ (D65), pre-divided by the reference white so LAB needs no extra step
+_XYZ_WHITE = (0.95047, 1.0, 1.08883)
+_RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+
+if HAS_NUMPY:
+    _SRGB_TO_LINEAR_ARRAY = np.array(_SRGB_TO_LINEAR, np.float64)
+    _RGB_TO_XYZ_ARRAY = (np.array(_RGB_TO_XYZ) / np.array(_XYZ_WHITE)[:, None]).T
+
+
 class ColorSystem:
     """Color processing system with perceptual mapping for terminal environments.
     
@@ -546,7 +842,6 @@ class ColorSystem:
     }
     
     @staticmethod
-    @lru_cache(maxsize=1024)
     def rgb_to_lab(r: int, g: int, b: int) -> Tuple[float, float, float]:
         """Convert RGB color to CIE-LAB color space for perceptual operations.
         
@@ -561,13 +856,13 @@ class ColorSystem:
         Returns:
             Tuple of (L*, a*, b*) values in CIE-LAB color space
         """
-        # Normalize RGB to [0, 1]
-        r, g, b = r / 255.0, g / 255.0, b / 255.0
-        
-        # Apply gamma correction (sRGB to linear RGB)
-        r = (r / 12.92) if r <= 0.04045 else ((r + 0.055) / 1.055) ** 2.4
-        g = (g / 12.92) if g <= 0.04045 else ((g + 0.055) / 1.055) ** 2.4
-        b = (b / 12.92) if b <= 0.04045 else ((b + 0.055) / 1.055) ** 2.4
+        # Gamma correction (sRGB to linear RGB) via the precomputed table for
+        # plain ints in range; anything else (floats, NumPy scalars) is computed
+        if (r.__class__ is int and g.__class__ is int and b.__class__ is int
+                and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            r, g, b = _SRGB_TO_LINEAR[r], _SRGB_TO_LINEAR[g], _SRGB_TO_LINEAR[b]
+        else:
+            r, g, b = _srgb_to_linear(r), _srgb_to_linear(g), _srgb_to_linear(b)
         
         # Linear RGB to XYZ using D65 white point matrix
         x = r * 0.4124564 + g * 0.3575761 + b * 0.1804375
@@ -576,7 +871,7 @@ class ColorSystem:
         
         # XYZ to LAB
         # Reference D65 white point
-        x_n, y_n, z_n = 0.95047, 1.0, 1.08883
+        x_n, y_n, z_n = _XYZ_WHITE
         
         # Normalize XYZ values
         x, y, z = x / x_n, y / y_n, z / z_n
@@ -593,7 +888,32 @@ class ColorSystem:
         return (L, a, b)
     
     @staticmethod
-    @lru_cache(maxsize=1024)
+    def rgb_to_lab_array(rgb: 'np.ndarray') -> 'np.ndarray':
+        """Convert an array of RGB colors to CIE-LAB in one vectorized pass.
+        
+        Args:
+            rgb: Integer array of shape (..., 3) with components in 0-255
+            
+        Returns:
+            Float array of shape (..., 3) holding (L*, a*, b*) per color
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Bulk color conversion requires NumPy. Install with 'pip install numpy'")
+        
+        linear = _SRGB_TO_LINEAR_ARRAY[np.asarray(rgb, dtype=np.intp)]
+        xyz = linear @ _RGB_TO_XYZ_ARRAY
+        f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+        
+        lab = np.empty_like(f)
+        lab[..., 0] = 116 * f[..., 1] - 16
+        lab[..., 1] = 500 * (f[..., 0] - f[..., 1])
+        lab[..., 2] = 200 * (f[..., 1] - f[..., 2])
+        return lab
+    
+    @staticmethod
     def color_distance(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> float:
         """Calculate perceptual distance between two colors using CIE94 formula.
         
@@ -608,8 +928,13 @@ class ColorSystem:
             Perceptual distance value (smaller = more similar)
         """
         # Convert both colors to LAB space
-        L1, a1, b1 = ColorSystem.rgb_to_lab(*color1)
-        L2, a2, b2 = ColorSystem.rgb_to_lab(*color2)
+        return ColorSystem._cie94(ColorSystem.rgb_to_lab(*color1), ColorSystem.rgb_to_lab(*color2))
+    
+    @staticmethod
+    def _cie94(lab1: Tuple[float, float, float], lab2: Tuple[float, float, float]) -> float:
+        """CIE94 distance between two colors already in LAB space."""
+        L1, a1, b1 = lab1
+        L2, a2, b2 = lab2
         
         # Calculate CIE94 color difference
         # Constants for graphic arts
@@ -643,12 +968,39 @@ class ColorSystem:
         
         return delta_E94
     
+    # Nearest palette entry per 8-unit RGB bin (32x32x32), filled on demand per mode
+    _ANSI_LUTS: Dict[int, bytearray] = {}
+    _LUT_UNSET = 0xFF
+    
+    @staticmethod
+    def ansi_palette(mode: int = 8) -> Tuple[str, ...]:
+        """Get the names of the ANSI colors available in a terminal mode.
+        
+        Args:
+            mode: Terminal color mode (8 or 16)
+            
+        Returns:
+            Color names in palette order, as indexed by the bulk lookups
+        """
+        return tuple(name for name in ColorSystem.ANSI_COLORS
+                     if mode != 8 or not name.startswith('bright_'))
+    
+    @classmethod
+    def _ansi_lut(cls, mode: int) -> bytearray:
+        """Get the nearest-color lookup cube for a mode, creating it empty if needed."""
+        key = 8 if mode == 8 else 16
+        lut = cls._ANSI_LUTS.get(key)
+        if lut is None:
+            lut = cls._ANSI_LUTS[key] = bytearray([cls._LUT_UNSET]) * (32 * 32 * 32)
+        return lut
+    
     @staticmethod
-    @lru_cache(maxsize=512)
     def find_closest_ansi_color(r: int, g: int, b: int, mode: int = 8) -> Tuple[int, str]:
         """Find the closest ANSI color to a given RGB value.
         
         Uses perceptual color matching to find the best terminal color representation.
+        Colors are matched per 8-unit RGB bin using the bin's center, and each bin's
+        answer is stored in a lookup cube so the search runs at most once per bin.
         
         Args:
             r: Red component (0-255)
@@ -659,28 +1011,126 @@ class ColorSystem:
         Returns:
             Tuple of (ANSI code, color name)
         """
-        # Determine which colors are available based on mode
-        colors = list(ColorSystem.ANSI_COLORS.items())
-        if mode == 8:  # 8-color mode, only use the base colors
-            colors = [(name, rgb) for name, rgb in colors if not name.startswith('bright_')]
+        palette = ColorSystem.ansi_palette(mode)
+        lut = ColorSystem._ansi_lut(mode)
+        key = ((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)
+        
+        index = lut[key]
+        if index == ColorSystem._LUT_UNSET:
+            center = ColorSystem.rgb_to_lab((r >> 3) * 8 + 4, (g >> 3) * 8 + 4, (b >> 3) * 8 + 4)
             
-        # Find closest color using perceptual color distance
-        min_distance = float('inf')
-        closest_name = 'white'  # Default fallback
+            # Find closest color using perceptual color distance
+            min_distance = float('inf')
+            index = 0
+            for i, color_lab in enumerate(ColorSystem._palette_lab(mode)):
+                distance = ColorSystem._cie94(center, color_lab)
+                if distance < min_distance:
+                    min_distance = distance
+                    index = i
+            lut[key] = index
+        
+        closest_name = palette[index]
+        return (ColorSystem.ANSI_CODES['fg'][closest_name], closest_name)
+    
+    @staticmethod
+    def find_closest_ansi_color_array(rgb: 'np.ndarray', mode: int = 8) -> 'np.ndarray':
+        """Find the closest ANSI color for every RGB value in an array.
         
-        for name, color_rgb in colors:
-            distance = ColorSystem.color_distance((r, g, b), color_rgb)
-            if distance < min_distance:
-                min_distance = distance
-                closest_name = name
+        Args:
+            rgb: Integer array of shape (..., 3) with components in 0-255
+            mode: Terminal color mode (8 or 16)
+            
+        Returns:
+            uint8 array of shape (...) indexing into ``ansi_palette(mode)``
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Bulk color matching requires NumPy. Install with 'pip install numpy'")
+        
+        table = ColorSystem._fill_ansi_lut(mode)
+        rgb = np.asarray(rgb)
+        r, g, b = rgb[..., 0] >> 3, rgb[..., 1] >> 3, rgb[..., 2] >> 3
+        return table.reshape(32, 32, 32)[r, g, b]
+    
+    @staticmethod
+    def _fill_ansi_lut(mode: int) -> 'np.ndarray':
+        """Complete a mode's lookup cube in place, returning it as a flat uint8 view."""
+        table = np.frombuffer(ColorSystem._ansi_lut(mode), np.uint8)
+        missing = np.flatnonzero(table == ColorSystem._LUT_UNSET)
+        
+        if missing.size:
+            # Fill every remaining bin at once with a vectorized CIE94 search
+            centers = np.stack([missing >> 10, (missing >> 5) & 31, missing & 31], axis=-1) * 8 + 4
+            table[missing] = ColorSystem._nearest_in_palette(
+                ColorSystem.rgb_to_lab_array(centers), np.array(ColorSystem._palette_lab(mode)))
+        return table
+    
+    @staticmethod
+    def find_closest_ansi_colors_bulk(rgb: 'np.ndarray', mode: int = 8) -> 'np.ndarray':
+        """Find the exact closest ANSI color for every RGB value in an array.
+        
+        Unlike ``find_closest_ansi_color_array`` no binning is applied: every
+        color is converted to LAB and compared against the whole palette with
+        CIE94 in one broadcast, so the result is exact per pixel.
+        
+        Args:
+            rgb: Integer array of shape (..., 3) with components in 0-255
+            mode: Terminal color mode (8 or 16)
+            
+        Returns:
+            uint8 array of shape (...) indexing into ``ansi_palette(mode)``
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Bulk color matching requires NumPy. Install with 'pip install numpy'")
         
-        # Get the corresponding ANSI code
-        ansi_code = ColorSystem.ANSI_CODES['fg'][closest_name]
+        rgb = np.asarray(rgb)
+        lab = ColorSystem.rgb_to_lab_array(rgb.reshape(-1, 3))
+        palette_lab = np.array(ColorSystem._palette_lab(mode))
+        return ColorSystem._nearest_in_palette(lab, palette_lab).reshape(rgb.shape[:-1])
+    
+    # LAB coordinates of each mode's palette, computed on first use
+    _PALETTE_LABS: Dict[int, Tuple[Tuple[float, float, float], ...]] = {}
+    
+    @classmethod
+    def _palette_lab(cls, mode: int) -> Tuple[Tuple[float, float, float], ...]:
+        """Get the LAB coordinates of the palette of a color mode, in palette order."""
+        key = 8 if mode == 8 else 16
+        if key not in cls._PALETTE_LABS:
+            cls._PALETTE_LABS[key] = tuple(
+                cls.rgb_to_lab(*cls.ANSI_COLORS[name]) for name in cls.ansi_palette(key))
+        return cls._PALETTE_LABS[key]
+    
+    @staticmethod
+    def _nearest_in_palette(lab: 'np.ndarray', palette_lab: 'np.ndarray',
+                            chunk: int = 65536) -> 'np.ndarray':
+        """Index of the CIE94-nearest palette entry for each row of an (N, 3) LAB array.
         
-        return (ansi_code, closest_name)
+        Squared distances are compared, which preserves the ordering; pixels are
+        processed in chunks to bound the (chunk, P) temporaries.
+        """
+        result = np.empty(len(lab), np.uint8)
+        pal = palette_lab[None, :, :]
+        pal_chroma = np.hypot(pal[..., 1], pal[..., 2])
+        
+        for start in range(0, len(lab), chunk):
+            lab1 = lab[start:start + chunk, None, :]
+            delta = lab1 - pal
+            c1 = np.hypot(lab1[..., 1], lab1[..., 2])
+            delta_c = c1 - pal_chroma
+            delta_h_sq = np.maximum(0, delta[..., 1] ** 2 + delta[..., 2] ** 2 - delta_c ** 2)
+            distance = (delta[..., 0] ** 2
+                        + (delta_c / (1 + 0.045 * c1)) ** 2
+                        + delta_h_sq / (1 + 0.015 * c1) ** 2)
+            result[start:start + chunk] = distance.argmin(axis=-1)
+        
+        return result
 
     @staticmethod
-    @lru_cache(maxsize=512)
     def rgb_to_256color_index(r: int, g: int, b: int) -> int:
         """Convert RGB to an index in the 256-color palette.
         
@@ -698,19 +1148,42 @@ class ColorSystem:
         # Check if this is grayscale (R=G=B)
         if r == g == b:
             # Map to grayscale range (232-255, 24 levels)
-            # Calculate closest level from the 24 available gray shades
-            gray_idx = min(23, max(0, round((r / 255) * 23)))
-            return 232 + gray_idx
+            # Integer rounding of r/255*23; an exact .5 can't occur, so this
+            # matches round() for every input
+            return 232 + (r * 23 + 127) // 255
         
         # Map to 6×6×6 RGB color cube (indices 16-231)
         # Each RGB component is quantized to 6 levels: 0, 51, 102, 153, 204, 255
-        r_idx = min(5, max(0, round((r / 255) * 5)))
-        g_idx = min(5, max(0, round((g / 255) * 5)))
-        b_idx = min(5, max(0, round((b / 255) * 5)))
+        r_idx = (r * 5 + 127) // 255
+        g_idx = (g * 5 + 127) // 255
+        b_idx = (b * 5 + 127) // 255
         
         # Calculate cube index: 16 + 36*r + 6*g + b
         return 16 + (r_idx * 36) + (g_idx * 6) + b_idx
     
+    @staticmethod
+    def rgb_to_256color_index_array(rgb: 'np.ndarray') -> 'np.ndarray':
+        """Convert an array of RGB colors to 256-color palette indices.
+        
+        Args:
+            rgb: Integer array of shape (..., 3) with components in 0-255
+            
+        Returns:
+            uint8 array of shape (...) with indices in 16-255
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Bulk color conversion requires NumPy. Install with 'pip install numpy'")
+        
+        rgb = np.asarray(rgb).astype(np.int32)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        
+        cube = 16 + ((r * 5 + 127) // 255) * 36 + ((g * 5 + 127) // 255) * 6 + (b * 5 + 127) // 255
+        gray = 232 + (r * 23 + 127) // 255
+        return np.where((r == g) & (g == b), gray, cube).astype(np.uint8)
+    
     @staticmethod
     def apply_color(
         char: str, 
@@ -736,50 +1209,36 @@ class ColorSystem:
             # Monochrome mode - no color support
             return char
         
-        r, g, b = fg_color
-        
-        # Start building ANSI escape sequence
-        fg_code = ""
-        bg_code = ""
-        
-        # Process foreground color based on terminal capabilities
-        if color_mode <= 16:
-            # 8 or 16 color terminal - map to basic ANSI colors
-            ansi_code, _ = ColorSystem.find_closest_ansi_color(r, g, b, color_mode)
-            fg_code = f"\033[{ansi_code}m"
-        
-        elif color_mode == 256:
-            # 256-color terminal - use extended color codes
-            color_idx = ColorSystem.rgb_to_256color_index(r, g, b)
-            fg_code = f"\033[38;5;{color_idx}m"
-        
-        else:
-            # True color (16M) terminal - use direct RGB values
-            fg_code = f"\033[38;2;{r};{g};{b}m"
-        
-        # Process background color if provided
-        if bg_color:
-            bg_r, bg_g, bg_b = bg_color
-            
-            if color_mode <= 16:
-                # 8 or 16 color terminal
-                bg_ansi_code, _ = ColorSystem.find_closest_ansi_color(bg_r, bg_g, bg_b, color_mode)
-                # Convert foreground code to background (40-47 or 100-107)
-                bg_index = ColorSystem.ANSI_CODES['bg'][_]
-                bg_code = f"\033[{bg_index}m"
-            
-            elif color_mode == 256:
-                # 256-color terminal
-                bg_color_idx = ColorSystem.rgb_to_256color_index(bg_r, bg_g, bg_b)
-                bg_code = f"\033[48;5;{bg_color_idx}m"
-            
-            else:
-                # True color terminal
-                bg_code = f"\033[48;2;{bg_r};{bg_g};{bg_b}m"
+        # Select escape prefixes from the precomputed tables
+        fg_code = foreground_prefix(fg_color, color_mode)
+        bg_code = background_prefix(bg_color, color_mode) if bg_color else ""
         
         # Combine codes, add character, and reset
         return f"{fg_code}{bg_code}{char}\033[0m"
 
+
+# Escape prefixes for every code the palette modes can produce
+_ANSI_FG_PREFIX = {name: f"\033[{code}m" for name, code in ColorSystem.ANSI_CODES['fg'].items()}
+_ANSI_BG_PREFIX = {name: f"\033[{code}m" for name, code in ColorSystem.ANSI_CODES['bg'].items()}
+_FG_256_PREFIX = tuple(f"\033[38;5;{i}m" for i in range(256))
+_BG_256_PREFIX = tuple(f"\033[48;5;{i}m" for i in range(256))
+
+# TrueColor escapes memoized by RGB tuple; images reuse a small set of colors
+# in practice, and the caches start over once they reach the cap
+_TRUECOLOR_CACHE_SIZE = 65536
+_TRUECOLOR_FG_PREFIX: Dict[Tuple[int, int, int], str] = {}
+_TRUECOLOR_BG_PREFIX: Dict[Tuple[int, int, int], str] = {}
+
+
+def _truecolor_prefix(cache: Dict[Tuple[int, int, int], str], layer: int,
+                      rgb: Tuple[int, int, int]) -> str:
+    """Format a TrueColor escape for ``layer`` (38 or 48) and remember it in ``cache``."""
+    if len(cache) >= _TRUECOLOR_CACHE_SIZE:
+        cache.clear()
+    r, g, b = rgb
+    code = cache[rgb] = f"\033[{layer};2;{r};{g};{b}m"
+    return code
+
 # Replace the existing function with ColorSystem's optimized version
 def apply_terminal_color(
     char: str, 
@@ -803,6 +1262,99 @@ def apply_terminal_color(
     return ColorSystem.apply_color(char, (r, g, b), bg_color, color_mode)
 
 
+def foreground_prefix(fg_color: Tuple[int, int, int], color_mode: int = 8) -> str:
+    """Get the foreground escape prefix for an RGB color in a terminal mode.
+    
+    Args:
+        fg_color: RGB foreground color tuple (r, g, b)
+        color_mode: Terminal color depth (8, 16, 256, 16M)
+        
+    Returns:
+        ANSI escape sequence selecting the foreground color
+    """
+    if color_mode <= 16:
+        # 8 or 16 color terminal - map to basic ANSI colors
+        r, g, b = fg_color
+        return _ANSI_FG_PREFIX[ColorSystem.find_closest_ansi_color(r, g, b, color_mode)[1]]
+    
+    if color_mode == 256:
+        # 256-color terminal - use extended color codes
+        r, g, b = fg_color
+        return _FG_256_PREFIX[ColorSystem.rgb_to_256color_index(r, g, b)]
+    
+    # True color (16M) terminal - use direct RGB values, formatted once per color
+    # Lists and other sequences are keyed as tuples so the memo stays hashable
+    key = fg_color if fg_color.__class__ is tuple else tuple(fg_color)
+    return (_TRUECOLOR_FG_PREFIX.get(key)
+            or _truecolor_prefix(_TRUECOLOR_FG_PREFIX, 38, key))
+
+
+def background_prefix(bg_color: Tuple[int, int, int], color_mode: int = 8) -> str:
+    """Get the background escape prefix for an RGB color in a terminal mode.
+    
+    Args:
+        bg_color: RGB background color tuple (r, g, b)
+        color_mode: Terminal color depth (8, 16, 256, 16M)
+        
+    Returns:
+        ANSI escape sequence selecting the background color
+    """
+    bg_r, bg_g, bg_b = bg_color
+    
+    if color_mode <= 16:
+        # 8 or 16 color terminal, background variant of the matched color
+        return _ANSI_BG_PREFIX[ColorSystem.find_closest_ansi_color(bg_r, bg_g, bg_b, color_mode)[1]]
+    
+    if color_mode == 256:
+        # 256-color terminal
+        return _BG_256_PREFIX[ColorSystem.rgb_to_256color_index(bg_r, bg_g, bg_b)]
+    
+    # True color terminal
+    # Lists and other sequences are keyed as tuples so the memo stays hashable
+    key = bg_color if bg_color.__class__ is tuple else tuple(bg_color)
+    return (_TRUECOLOR_BG_PREFIX.get(key)
+            or _truecolor_prefix(_TRUECOLOR_BG_PREFIX, 48, key))
+
+
+def foreground_codes(rgb: 'np.ndarray', color_mode: int = 8) -> Tuple['np.ndarray', Tuple[str, ...]]:
+    """Split the foreground escapes for an array of RGB values into codes and a table.
+    
+    ``table[codes]`` is the prefix ``apply_color`` would emit for each value.
+    Palette modes index the precomputed prefix tables with the bulk matchers;
+    TrueColor formats one escape per distinct color rather than per pixel.
+    
+    Args:
+        rgb: Integer array of shape (..., 3) with components in 0-255
+        color_mode: Terminal color depth (8, 16, 256, 16M)
+        
+    Returns:
+        Tuple of (integer code array of shape (...), escape prefix per code)
+        
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if not HAS_NUMPY:
+        raise ImportError("Bulk color conversion requires NumPy. Install with 'pip install numpy'")
+    
+    rgb = np.asarray(rgb)
+    if color_mode <= 16:
+        table = tuple(_ANSI_FG_PREFIX[name] for name in ColorSystem.ansi_palette(color_mode))
+        return ColorSystem.find_closest_ansi_color_array(rgb, color_mode), table
+    
+    if color_mode == 256:
+        return ColorSystem.rgb_to_256color_index_array(rgb), _FG_256_PREFIX
+    
+    packed = (rgb[..., 0].astype(np.int32) << 16) | (rgb[..., 1].astype(np.int32) << 8) | rgb[..., 2]
+    colors, inverse = np.unique(packed, return_inverse=True)
+    table = tuple(f"\033[38;2;{c >> 16};{(c >> 8) & 255};{c & 255}m" for c in colors.tolist())
+    return inverse.reshape(packed.shape), table
+
+
+# Nearest 6×6×6 cube level per channel value, as used by 256-color quantization
+_CUBE_STEPS = (0, 51, 102, 153, 204, 255)
+_CUBE_STEP_LUT = tuple(_CUBE_STEPS[min(5, max(0, round((v / 255) * 5)))] for v in range(256))
+
+
 class ColorDithering:
     """Color dithering algorithms for reducing color banding in limited color environments.
     
@@ -810,18 +1362,44 @@ class ColorDithering:
     allowing for better color representation in terminals with limited color capability.
     """
     
+    # Single-pixel 'P' images carrying each target palette, built on first use
+    _PALETTE_IMAGES: Dict[int, 'Image.Image'] = {}
+    
+    @classmethod
+    def _palette_image(cls, palette_size: int) -> 'Image.Image':
+        """Get a 'P' image whose palette holds the colors of a target palette size."""
+        key = palette_size if palette_size in (8, 16) else 256
+        if key not in cls._PALETTE_IMAGES:
+            if key == 256:
+                steps = _CUBE_STEPS
+                colors = [(r, g, b) for r in steps for g in steps for b in steps]
+            else:
+                colors = [ColorSystem.ANSI_COLORS[name] for name in ColorSystem.ansi_palette(key)]
+            
+            flat = [channel for color in colors for channel in color]
+            # Padding repeats black, which every palette already contains
+            palette = Image.new('P', (1, 1))
+            palette.putpalette(flat + [0] * (768 - len(flat)))
+            cls._PALETTE_IMAGES[key] = palette
+        return cls._PALETTE_IMAGES[key]
+    
     @staticmethod
     def floyd_steinberg(
         image: 'Image.Image', 
-        palette_size: int = 16
+        palette_size: int = 16,
+        perceptual: bool = False
     ) -> 'Image.Image':
         """Apply Floyd-Steinberg dithering for color reduction.
         
-        Preserves perceptual color fidelity while reducing to a smaller palette.
+        By default this runs Pillow's built-in C quantizer against the target
+        palette, which matches colors by RGB distance. With ``perceptual`` set,
+        the error diffusion runs here and matches ANSI colors with CIE94 instead,
+        at a much higher cost per pixel.
         
         Args:
             image: PIL Image to dither
             palette_size: Target color palette size (8, 16, or 256)
+            perceptual: Match palette colors perceptually instead of in RGB
             
         Returns:
             Dithered PIL Image with reduced colors
@@ -830,79 +1408,93 @@ class ColorDithering:
         img = image.convert('RGB')
         width, height = img.size
         
-        # Create pixel access objects
-        pixels = img.load()
+        # Pillow < 9.1 has no Image.Dither; fall through to the loop below there
+        if not perceptual and hasattr(Image, 'Dither'):
+            return img.quantize(
+                palette=ColorDithering._palette_image(palette_size),
+                dither=Image.Dither.FLOYDSTEINBERG,
+            ).convert('RGB')
+        
+        # Function to quantize a color to target palette, chosen once per image
+        if palette_size == 8 or palette_size == 16:
+            # Map to ANSI colors through the nearest-color cube, filled up front when possible
+            lut = ColorSystem._ansi_lut(palette_size)
+            if HAS_NUMPY:
+                ColorSystem._fill_ansi_lut(palette_size)
+            palette_rgb = tuple(ColorSystem.ANSI_COLORS[name]
+                                for name in ColorSystem.ansi_palette(palette_size))
+            
+            def quantize_color(r: int, g: int, b: int) -> Tuple[int, int, int]:
+                index = lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+                if index == ColorSystem._LUT_UNSET:
+                    _, color_name = ColorSystem.find_closest_ansi_color(r, g, b, palette_size)
+                    return ColorSystem.ANSI_COLORS[color_name]
+                return palette_rgb[index]
+        else:
+            def quantize_color(r: int, g: int, b: int) -> Tuple[int, int, int]:
+                # 256 colors - snap each channel to the 6×6×6 color cube by table
+                return (_CUBE_STEP_LUT[r], _CUBE_STEP_LUT[g], _CUBE_STEP_LUT[b])
         
-        # Function to quantize a color to target palette
-        def quantize_color(r: int, g: int, b: int) -> Tuple[int, int, int]:
+        if HAS_NUMBA:
+            buf = np.asarray(img).astype(np.int16)
             if palette_size == 8 or palette_size == 16:
-                # Map to ANSI colors
-                _, color_name = ColorSystem.find_closest_ansi_color(r, g, b, palette_size)
-                return ColorSystem.ANSI_COLORS[color_name]
+                cube, palette = ColorSystem._fill_ansi_lut(palette_size), np.array(palette_rgb, np.int16)
             else:
-                # 256 colors - use the 6×6×6 color cube quantization
-                steps = [0, 51, 102, 153, 204, 255]
-                r_q = steps[min(5, max(0, round((r / 255) * 5)))]
-                g_q = steps[min(5, max(0, round((g / 255) * 5)))]
-                b_q = steps[min(5, max(0, round((b / 255) * 5)))]
-                return (r_q, g_q, b_q)
+                cube, palette = np.empty(0, np.uint8), np.empty((0, 3), np.int16)
+            _color_fs_kernel(buf, height, width, cube, palette, np.array(_CUBE_STEP_LUT, np.int16))
+            return Image.fromarray(buf.astype(np.uint8))
         
         # Process the image with Floyd-Steinberg error diffusion
+        pixels = list(img.tobytes())
+        stride = 3 * width
+        below = [0] * (stride + 6)
+        
         for y in range(height):
-            for x in range(width):
-                # Get original pixel color
-                r, g, b = pixels[x, y]
-                
-                # Quantize to target palette
-                r_new, g_new, b_new = quantize_color(r, g, b)
-                
-                # Set the new pixel value
-                pixels[x, y] = (r_new, g_new, b_new)
-                
-                # Calculate quantization error
-                error_r = r - r_new
-                error_g = g - g_new
-                error_b = b - b_new
-                
-                # Distribute errors - Floyd-Steinberg pattern
-                # Right pixel (7/16)
-                if x < width - 1:
-                    r_right, g_right, b_right = pixels[x + 1, y]
-                    pixels[x + 1, y] = (
-                        min(255, max(0, r_right + (error_r * 7) // 16)),
-                        min(255, max(0, g_right + (error_g * 7) // 16)),
-                        min(255, max(0, b_right + (error_b * 7) // 16))
-                    )
-                
-                # Next row pixels
-                if y < height - 1:
-                    # Bottom-left pixel (3/16)
-                    if x > 0:
-                        r_bl, g_bl, b_bl = pixels[x - 1, y + 1]
-                        pixels[x - 1, y + 1] = (
-                            min(255, max(0, r_bl + (error_r * 3) // 16)),
-                            min(255, max(0, g_bl + (error_g * 3) // 16)),
-                            min(255, max(0, b_bl + (error_b * 3) // 16))
-                        )
-                    
-                    # Bottom pixel (5/16)
-                    r_b, g_b, b_b = pixels[x, y + 1]
-                    pixels[x, y + 1] = (
-                        min(255, max(0, r_b + (error_r * 5) // 16)),
-                        min(255, max(0, g_b + (error_g * 5) // 16)),
-                        min(255, max(0, b_b + (error_b * 5) // 16))
-                    )
-                    
-                    # Bottom-right pixel (1/16)
-                    if x < width - 1:
-                        r_br, g_br, b_br = pixels[x + 1, y + 1]
-                        pixels[x + 1, y + 1] = (
-                            min(255, max(0, r_br + (error_r * 1) // 16)),
-                            min(255, max(0, g_br + (error_g * 1) // 16)),
-                            min(255, max(0, b_br + (error_b * 1) // 16))
-                        )
+            row = pixels[y * stride:(y + 1) * stride]
+            cur, below = below, [0] * (stride + 6)
+            pixels[y * stride:(y + 1) * stride] = ColorDithering._scan_row(
+                row, cur, below, quantize_color)
+        
+        return Image.frombytes('RGB', (width, height), bytes(pixels))
+    
+    @staticmethod
+    def _scan_row(
+        row: List[int],
+        cur: List[int],
+        below: List[int],
+        quantize_color: Callable[[int, int, int], Tuple[int, int, int]]
+    ) -> List[int]:
+        """Quantize one flat RGB row, carrying error in sixteenths.
+        
+        Error accumulates unscaled, as ``error * weight``, and is divided by 16
+        once when a pixel is read, so no precision is lost to per-term integer
+        division and only the value handed to the quantizer is clamped.
+        ``cur`` holds this row's accumulated error and ``below`` collects the
+        next row's; both are padded by one pixel (three slots) on each side.
         
-        return img
+        Returns:
+            The quantized row
+        """
+        for i in range(0, len(row), 3):
+            j = i + 3
+            r = row[i] + (cur[j] >> 4)
+            g = row[i + 1] + (cur[j + 1] >> 4)
+            b = row[i + 2] + (cur[j + 2] >> 4)
+            r = 255 if r > 255 else (0 if r < 0 else r)
+            g = 255 if g > 255 else (0 if g < 0 else g)
+            b = 255 if b > 255 else (0 if b < 0 else b)
+            
+            r_new, g_new, b_new = quantize_color(r, g, b)
+            row[i], row[i + 1], row[i + 2] = r_new, g_new, b_new
+            
+            # Right (7/16), bottom-left (3/16), bottom (5/16), bottom-right (1/16)
+            for c, error in ((0, r - r_new), (1, g - g_new), (2, b - b_new)):
+                cur[j + 3 + c] += error * 7
+                below[i + c] += error * 3
+                below[j + c] += error * 5
+                below[j + 3 + c] += error
+        
+        return row
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🖼️ Core Transformation Engine - Pixel Alchemy      │
@@ -1044,10 +1636,13 @@ def convert(
 # │  🛠️ Utility Functions - Precision Tools             │
 # ╰──────────────────────────────────────────────────────╯
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=1)
 def get_terminal_size() -> Tuple[int, int]:
     """Get terminal dimensions with caching for performance.
     
+    The cached size is dropped on SIGWINCH where the platform has it; see
+    ``invalidate_terminal_cache`` for forcing re-detection elsewhere.
+    
     Returns:
         Tuple of (width, height) in characters
     """
@@ -1065,9 +1660,13 @@ def get_terminal_size() -> Tuple[int, int]:
             # Default fallback values
             return (80, 24)
 
+@lru_cache(maxsize=1)
 def detect_color_support() -> int:
     """Detect terminal color support level.
     
+    The environment is inspected once and the result cached; call
+    ``detect_color_support.cache_clear()`` after changing ``TERM``/``COLORTERM``.
+    
     Returns:
         Color depth: 1 (monochrome), 8, 16, 256, or 16777216 (16M)
     """
@@ -1090,6 +1689,40 @@ def detect_color_support() -> int:
     # Default to monochrome if unsure
     return 1
 
+def invalidate_terminal_cache() -> None:
+    """Forget the cached terminal size and color support.
+    
+    The next ``get_terminal_size``/``detect_color_support`` call inspects the
+    terminal again, e.g. after tests change ``TERM`` or ``COLORTERM``.
+    """
+    get_terminal_size.cache_clear()
+    detect_color_support.cache_clear()
+
+
+def _install_resize_handler() -> None:
+    """Clear the cached terminal size whenever the terminal is resized.
+    
+    Any handler already installed for SIGWINCH keeps running. Platforms without
+    SIGWINCH, and imports off the main thread, where handlers can't be set,
+    keep the cache until ``invalidate_terminal_cache`` is called.
+    """
+    if not hasattr(signal, 'SIGWINCH'):
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+    
+    def on_resize(signum, frame):
+        get_terminal_size.cache_clear()
+        if callable(previous):
+            previous(signum, frame)
+    
+    try:
+        signal.signal(signal.SIGWINCH, on_resize)
+    except ValueError:
+        pass
+
+
+_install_resize_handler()
+
 def create_figlet_art(text: str, font: str = "standard") -> str:
     """Create ASCII text art using Figlet-style fonts.
     
@@ -1119,19 +1752,11 @@ def create_figlet_art(text: str, font: str = "standard") -> str:
     chosen_font = fonts[font]
     text = text.upper()  # Convert to uppercase for simple fonts
     
-    # Initialize result
-    result = [''] * 5  # Assuming 5 lines per character
-    
-    for char in text:
-        if char in chosen_font:
-            for i, line in enumerate(chosen_font[char]):
-                result[i] += line
-        else:
-            # For unsupported characters, add space
-            for i in range(5):
-                result[i] += '     '
+    # Collect glyph rows per output line and join once, keeping the build linear
+    blank = ['     '] * 5  # Unsupported characters render as space
+    glyphs = [chosen_font.get(char, blank) for char in text]
     
-    return '\n'.join(result)
+    return '\n'.join(''.join(rows) for rows in zip(*glyphs)) if glyphs else '\n' * 4
 
 def create_banner(title: str, width: int = 40, char: str = '*') -> str:
     """Create a simple banner with a title.
@@ -1148,11 +1773,8 @@ def create_banner(title: str, width: int = 40, char: str = '*') -> str:
         title = title[:width-7] + "..."
     
     padding = ' ' * ((width - len(title) - 4) // 2)
-    return (
-        f"{char * width}\n"
-        f"{char} {padding}{title}{padding} {char}\n"
-        f"{char * width}"
-    )
+    border = char * width
+    return "\n".join((border, f"{char} {padding}{title}{padding} {char}", border))
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🔌 Integration Point - Public Interface             │
@@ -1195,6 +1817,21 @@ def transform_image(
 # │  🧠 Image Processing - Visual Intelligence Core      │
 # ╰──────────────────────────────────────────────────────╯
 
+_backend_hint_shown = False
+
+
+def _hint_pil_backend() -> None:
+    """Log once that Pillow-SIMD would speed up the resize and convert steps."""
+    global _backend_hint_shown
+    if _backend_hint_shown or PIL_BACKEND != 'pillow':
+        return
+    _backend_hint_shown = True
+    logger.info(
+        "Using stock Pillow; Pillow-SIMD accelerates resizing and grayscale conversion: "
+        "pip uninstall -y pillow && CC='cc -mavx2' pip install -U --force-reinstall pillow-simd"
+    )
+
+
 def load_image(source: ImageSource) -> 'Image.Image':
     """Load image from various source types with intelligent handling.
     
@@ -1214,6 +1851,7 @@ def load_image(source: ImageSource) -> 'Image.Image':
     """
     if not HAS_PIL:
         raise ImportError("Image processing requires Pillow. Install with 'pip install Pillow'")
+    _hint_pil_backend()
     
     # Handle different source types
     if isinstance(source, (str, Path)):
@@ -1291,8 +1929,6 @@ def preprocess_image(
         
         # Apply slight color vibrance enhancement
         if img.mode == "RGB" or img.mode == "RGBA":
-            from PIL import ImageChops
-            
             # Create more vibrant colors by increasing saturation
             # This is done by creating an overlay of the image with itself
             overlay = ImageChops.multiply(img, img)
@@ -1303,7 +1939,6 @@ def preprocess_image(
         # Edge detection for line art effect
         img = img.convert("L")  # Convert to grayscale
         try:
-            from PIL import ImageFilter
             # Apply edge detection filter
             edge_img = img.filter(ImageFilter.FIND_EDGES)
             # Enhance the edges
@@ -1318,8 +1953,6 @@ def preprocess_image(
         # Pencil sketch effect
         img = img.convert("L")  # Convert to grayscale
         try:
-            from PIL import ImageFilter, ImageChops
-            
             # Create blurred version
             blur = img.filter(ImageFilter.GaussianBlur(radius=3))
             
@@ -1341,11 +1974,90 @@ def preprocess_image(
     return img
 
 
+def _blend_lut(factor: float, base: int) -> List[int]:
+    """Tabulate ``ImageEnhance``'s blend of a constant ``base`` image toward each gray level.
+    
+    Pillow computes ``base + factor * (v - base)`` in single precision and
+    truncates, so the table does the same to reproduce it bit for bit.
+    """
+    if HAS_NUMPY:
+        v = np.arange(256, dtype=np.float32)
+        out = np.trunc(np.float32(base) + np.float32(factor) * (v - np.float32(base)))
+        return np.clip(out, 0, 255).astype(np.uint8).tolist()
+    # Round each intermediate to single precision through a float32 array
+    f32 = array('f', [0.0])
+    
+    def single(x: float) -> float:
+        f32[0] = x
+        return f32[0]
+    
+    factor = single(factor)
+    return [min(255, max(0, int(single(base + single(factor * (v - base)))))) for v in range(256)]
+
+
+def adjust_levels(
+    image: 'Image.Image',
+    style: str = "detailed",
+    brightness: float = 1.0,
+    contrast: float = 1.0,
+    sharpness: float = 1.0,
+    invert: bool = False,
+) -> 'Image.Image':
+    """Apply the "minimal" and "detailed" preprocessing through lookup tables.
+    
+    Matches ``preprocess_image`` for those styles on 'L' and 'RGB' images, but
+    brightness, contrast and inversion each become one ``Image.point`` table
+    pass with no intermediate enhancer images. ``convert`` runs it after
+    resizing, so the work scales with the output size, not the source.
+    
+    Args:
+        image: PIL Image in mode 'L' or 'RGB'
+        style: "minimal" or "detailed"
+        brightness: Brightness adjustment factor
+        contrast: Contrast adjustment factor
+        sharpness: Sharpness adjustment factor ("detailed" only)
+        invert: Whether to invert the image
+        
+    Returns:
+        Processed PIL Image
+    """
+    if style == "minimal":
+        img = ImageOps.grayscale(image)
+        contrast *= 1.5
+    else:
+        img = image
+        if brightness != 1.0:
+            img = img.point(_blend_lut(brightness, 0) * len(img.getbands()))
+    
+    # Contrast pivots on the rounded mean gray level, as ImageEnhance.Contrast does
+    histogram = (img if img.mode == "L" else img.convert("L")).histogram()
+    mean = int(sum(v * n for v, n in enumerate(histogram)) / sum(histogram) + 0.5)
+    lut = _blend_lut(contrast, mean)
+    
+    sharpen = style != "minimal" and sharpness != 1.0
+    if invert and not sharpen:
+        # Inversion is pointwise, so it folds into the same table
+        lut = [255 - v for v in lut]
+    img = img.point(lut * len(img.getbands()))
+    
+    if sharpen:
+        img = ImageEnhance.Sharpness(img).enhance(sharpness)
+        if invert:
+            img = ImageOps.invert(img)
+    
+    return img
+
+
+# Downscale ratio beyond which resizing box-reduces before resampling
+RESIZE_REDUCING_GAP = 3.0
+
+
 def resize_image_with_aspect(
     image: 'Image.Image',
     width: int,
     height: Optional[int] = None,
-    char_aspect_ratio: float = 0.5
+    char_aspect_ratio: float = 0.5,
+    fast_resize: bool = True
 ) -> 'Image.Image':
     """Resize image with proper aspect ratio preservation for ASCII art.
     
@@ -1357,6 +2069,8 @@ def resize_image_with_aspect(
         width: Target width in characters
         height: Optional target height (preserves aspect if None)
         char_aspect_ratio: Width-to-height ratio of a character in terminal
+        fast_resize: Box-reduce large downscales by an integer factor before
+            the final LANCZOS pass (indistinguishable at character resolution)
         
     Returns:
         Resized PIL Image
@@ -1374,10 +2088,14 @@ def resize_image_with_aspect(
     width = max(1, width)
     height = max(1, height)
     
-    # Use high quality resampling methods
+    # Use high quality resampling methods. With a reducing gap Pillow first box-reduces
+    # while the source is over RESIZE_REDUCING_GAP times the target, so LANCZOS runs
+    # on a small image instead of over the full source
     try:
+        if fast_resize:
+            return image.resize((width, height), Image.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
         return image.resize((width, height), Image.LANCZOS)
-    except (AttributeError, ValueError):
+    except (AttributeError, ValueError, TypeError):
         # Fallback for older PIL versions
         return image.resize((width, height), Image.BICUBIC)
 
@@ -1389,11 +2107,19 @@ class AsciiRenderer:
     optimized algorithms and customizable rendering strategies.
     """
     
+    # Brightness calculation strategies, shared by every renderer
+    BRIGHTNESS_STRATEGIES: Dict[str, Callable[[int, int, int], float]] = {
+        "average": lambda r, g, b: (r + g + b) / 3,
+        "luminance": lambda r, g, b: 0.299 * r + 0.587 * g + 0.114 * b,
+        "max": lambda r, g, b: max(r, g, b)
+    }
+    
     def __init__(self, 
                  character_set: str = "standard", 
                  custom_chars: Optional[str] = None,
                  brightness_strategy: str = "average",
-                 invert_mapping: bool = False):
+                 invert_mapping: bool = False,
+                 emit_per_char_reset: bool = False):
         """Initialize the ASCII renderer with specific parameters.
         
         Args:
@@ -1401,7 +2127,11 @@ class AsciiRenderer:
             custom_chars: Custom character sequence (used if character_set is "custom")
             brightness_strategy: How pixel brightness is calculated ("average", "luminance", "max")
             invert_mapping: Whether to invert the brightness-to-character mapping
+            emit_per_char_reset: Color and reset every character instead of once per
+                run of same-colored characters (larger output, easier to debug)
         """
+        self.emit_per_char_reset = emit_per_char_reset
+        
         # Set up character mapping
         if character_set == "custom" and custom_chars:
             self.chars = custom_chars
@@ -1416,16 +2146,26 @@ class AsciiRenderer:
             self.chars = self.chars[::-1]
         
         # Set brightness calculation strategy
-        brightness_strategies = {
-            "average": lambda r, g, b: (r + g + b) / 3,
-            "luminance": lambda r, g, b: 0.299 * r + 0.587 * g + 0.114 * b,
-            "max": lambda r, g, b: max(r, g, b)
-        }
-        
-        if brightness_strategy not in brightness_strategies:
+        if brightness_strategy not in self.BRIGHTNESS_STRATEGIES:
             raise ValueError("Brightness strategy must be 'average', 'luminance', or 'max'")
         
-        self.calc_brightness = brightness_strategies[brightness_strategy]
+        self.calc_brightness = self.BRIGHTNESS_STRATEGIES[brightness_strategy]
+        self.brightness_strategy = brightness_strategy
+        
+        # Lookup tables depend only on the ramp and the strategy, so renderers share them
+        self._gray_table, sums, self._char_array, self._cell_tables = _ramp_tables(
+            self.chars, brightness_strategy)
+        
+        # Per-pixel character lookup for the scalar render loop. Average brightness
+        # depends only on r + g + b and max brightness is an integer level, so both
+        # tabulate exactly; luminance is computed per pixel
+        if brightness_strategy == "average":
+            self._rgb_to_char = lambda r, g, b: sums[r + g + b]
+        elif brightness_strategy == "max":
+            levels = self._gray_table
+            self._rgb_to_char = lambda r, g, b: levels[max(r, g, b)]
+        else:
+            self._rgb_to_char = lambda r, g, b: self.map_pixel_to_char((r, g, b))
     
     def map_pixel_to_char(self, pixel: Union[Tuple[int, ...], int]) -> str:
         """Map a pixel to a character based on brightness.
@@ -1467,52 +2207,218 @@ class AsciiRenderer:
         Returns:
             List of strings representing ASCII art rows
         """
+        if image.mode == "L" and color_mode <= 1:
+            return self.render_gray(image)
+        
+        # Normalize every other mode to L, RGB or RGBA once, before any row work
+        if image.mode not in ("L", "RGB", "RGBA"):
+            image = image.convert("RGB")
+        
+        if HAS_NUMPY:
+            return self._render_array(image, color_mode, bg_color)
+        
+        # Read the raw buffer once
         width, height = image.size
-        pixels = image.load()
+        channels = len(image.mode)
+        data = image.tobytes()
+        stride = width * channels
         
         # Prepare output
         lines = []
         
+        # Runs of one color share a single escape; the line ends with one reset
+        run_length = color_mode > 1 and not self.emit_per_char_reset
+        bg_code = background_prefix(bg_color, color_mode) if run_length and bg_color else ""
+        
+        rgb_to_char = self._rgb_to_char
+        apply_color = ColorSystem.apply_color
+        opaque = repeat(255)
+        
         # Process each row
         for y in range(height):
             line = []
+            row = data[y * stride:(y + 1) * stride]
+            current = None
+            # Unpack the row once into (r, g, b, a) so the column loop has no mode checks
+            if channels == 1:
+                pixels = zip(row, row, row, opaque)
+            elif channels == 3:
+                pixels = zip(row[0::3], row[1::3], row[2::3], opaque)
+            else:
+                pixels = zip(row[0::4], row[1::4], row[2::4], row[3::4])
+            
             # Process each column in the row
-            for x in range(width):
-                try:
-                    # Extract pixel data based on image mode
-                    if image.mode == "RGBA":
-                        r, g, b, a = pixels[x, y]
-                        if a < 128:  # Handle transparency
-                            line.append(" ")
-                            continue
-                    elif image.mode == "RGB":
-                        r, g, b = pixels[x, y]
-                    elif image.mode == "L":
-                        r = g = b = pixels[x, y]
-                    else:
-                        # For other modes, ensure we have RGB data
-                        rgb_val = image.getpixel((x, y))
-                        if isinstance(rgb_val, (tuple, list)) and len(rgb_val) >= 3:
-                            r, g, b = rgb_val[:3]
-                        else:
-                            r = g = b = rgb_val
-                    
-                    # Map pixel to character
-                    char = self.map_pixel_to_char((r, g, b))
-                    
-                    # Apply terminal colors if in color mode
-                    if color_mode > 1:
-                        char = apply_terminal_color(char, r, g, b, color_mode, bg_color)
-                    
-                    line.append(char)
-                except (IndexError, TypeError):
-                    # Fallback for any error
+            for r, g, b, a in pixels:
+                if a < 128:  # Handle transparency
+                    if run_length and current != "":
+                        # Transparent cells drop any active color
+                        current = ""
+                        line.append("\033[0m")
                     line.append(" ")
+                    continue
+                
+                # Map pixel to character
+                char = rgb_to_char(r, g, b)
+                
+                # Apply terminal colors if in color mode
+                if run_length:
+                    prefix = foreground_prefix((r, g, b), color_mode) + bg_code
+                    if prefix != current:
+                        current = prefix
+                        char = prefix + char
+                elif color_mode > 1:
+                    char = apply_color(char, (r, g, b), bg_color, color_mode)
+                
+                line.append(char)
             
             # Add completed line
+            if run_length:
+                line.append("\033[0m")
             lines.append("".join(line))
         
         return lines
+    
+    def _render_array(self,
+                      image: 'Image.Image',
+                      color_mode: int,
+                      bg_color: Optional[Tuple[int, int, int]]) -> List[str]:
+        """NumPy body of ``render_image``: same output, computed a whole image at a time.
+        
+        Expects an L, RGB or RGBA image, as normalized by ``render_image``.
+        
+        Brightness is evaluated with the same float expressions as the scalar
+        strategies, so character choices match ``map_pixel_to_char`` exactly.
+        """
+        opaque = None
+        if image.mode == "L":
+            rgb = np.repeat(np.asarray(image)[..., None], 3, axis=-1)
+        elif image.mode == "RGBA":
+            rgba = np.asarray(image)
+            rgb, opaque = rgba[..., :3], rgba[..., 3] >= 128
+        else:
+            rgb = np.asarray(image)
+        
+        r, g, b = (rgb[..., c].astype(np.float64) for c in range(3))
+        if self.brightness_strategy == "average":
+            brightness = (r + g + b) / 3
+        elif self.brightness_strategy == "luminance":
+            brightness = 0.299 * r + 0.587 * g + 0.114 * b
+        else:
+            brightness = np.maximum(np.maximum(r, g), b)
+        
+        last = len(self.chars) - 1
+        indices = np.clip(((brightness / 255) * last).astype(np.intp), 0, last)
+        
+        if color_mode <= 1:
+            cells = self._char_array[indices]
+            if opaque is not None:
+                cells[~opaque] = " "
+            return ["".join(row) for row in cells.tolist()]
+        
+        # In palette modes every colored cell is one of len(prefixes) * len(chars)
+        # finished strings, so cells are gathered from a table rather than built per pixel
+        codes, prefixes = foreground_codes(rgb, color_mode)
+        codes = codes.astype(np.intp)
+        if color_mode <= 256:
+            colored = self._cell_table(prefixes, color_mode, bg_color)[codes * len(self.chars) + indices]
+        else:
+            # TrueColor prefixes follow the image's own colors; join them per cell
+            colored = (np.array(prefixes, dtype=object)[codes]
+                       + self._cell_tails(color_mode, bg_color)[indices])
+        
+        if self.emit_per_char_reset:
+            cells = colored
+            if opaque is not None:
+                cells[~opaque] = " "
+            return ["".join(row) for row in cells.tolist()]
+        
+        # Only the first cell of each run of one color carries the escape
+        if opaque is not None:
+            codes = np.where(opaque, codes, -1)
+        starts = np.ones(codes.shape, dtype=bool)
+        starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+        
+        cells = self._char_array[indices]
+        cells[starts] = colored[starts]
+        if opaque is not None:
+            # Transparent cells drop any active color
+            cells[~opaque] = " "
+            cells[~opaque & starts] = "\033[0m "
+        
+        return ["".join(row) + "\033[0m" for row in cells.tolist()]
+    
+    def _cell_tails(self, color_mode: int, bg_color: Optional[Tuple[int, int, int]]) -> 'np.ndarray':
+        """Get what follows each foreground prefix: background escape, character and reset.
+        
+        The reset is only part of a cell when ``emit_per_char_reset`` is set;
+        otherwise rows end with a single one.
+        """
+        # Background is one color for the whole image, so its prefix is taken once
+        bg_code = background_prefix(bg_color, color_mode) if bg_color else ""
+        reset = "\033[0m" if self.emit_per_char_reset else ""
+        return np.array([f"{bg_code}{char}{reset}" for char in self.chars], dtype=object)
+    
+    def _cell_table(self,
+                    prefixes: Tuple[str, ...],
+                    color_mode: int,
+                    bg_color: Optional[Tuple[int, int, int]]) -> 'np.ndarray':
+        """Get every colored cell string of a palette mode, indexed by ``code * len(chars) + char``.
+        
+        The table depends only on the mode and background, so it is built once
+        and kept with the ramp's other tables.
+        """
+        key = (color_mode, bg_color, self.emit_per_char_reset)
+        table = self._cell_tables.get(key)
+        if table is None:
+            tails = self._cell_tails(color_mode, bg_color).tolist()
+            table = self._cell_tables[key] = np.array(
+                [prefix + tail for prefix in prefixes for tail in tails], dtype=object)
+        return table
+    
+    def render_gray(self, gray: Union['np.ndarray', 'Image.Image']) -> List[str]:
+        """Render uncolored grayscale pixels to ASCII art in one table lookup.
+        
+        Produces the same characters as ``render_image`` for a monochrome 'L'
+        image, mapping every byte through a precomputed table instead of
+        per-pixel Python calls.
+        
+        Args:
+            gray: 2D uint8 array or PIL Image in mode 'L'
+            
+        Returns:
+            List of strings representing ASCII art rows
+        """
+        return map_gray_to_chars(gray, self._gray_table)
+
+
+@lru_cache(maxsize=64)
+def _ramp_tables(chars: str, brightness_strategy: str) -> Tuple[str, Tuple[str, ...], Any, Dict]:
+    """Build the lookup tables an ``AsciiRenderer`` needs for a character ramp.
+    
+    Cached by ramp and strategy, so repeated ``convert`` calls, which each create
+    a renderer, reuse the tables instead of rebuilding them.
+    
+    Returns:
+        Tuple of (256-entry grayscale lookup string, characters indexed by
+        r + g + b for average brightness, ramp as a NumPy object array or None,
+        shared dict of colored cell tables)
+    """
+    calc_brightness = AsciiRenderer.BRIGHTNESS_STRATEGIES[brightness_strategy]
+    last = len(chars) - 1
+    
+    def char_at(brightness: float) -> str:
+        return chars[max(0, min(int((brightness / 255) * last), last))]
+    
+    # Average and max brightness of (v, v, v) is exactly v, so the plain ramp
+    # table applies; luminance weights can round below v
+    if brightness_strategy != "luminance":
+        gray_table = _build_char_lut(chars)
+    else:
+        gray_table = ''.join(char_at(calc_brightness(v, v, v)) for v in range(256))
+    
+    sums = tuple(char_at(calc_brightness(s, 0, 0)) for s in range(766)) if brightness_strategy == "average" else ()
+    char_array = np.array(list(chars), dtype=object) if HAS_NUMPY else None
+    return gray_table, sums, char_array, {}
 
 
 # Enhanced core transformation function
@@ -1568,20 +2474,19 @@ def convert(
     # Load image from source
     img = load_image(image_source)
     
-    # Apply preprocessing based on style
-    img = preprocess_image(
-        img, style, brightness, contrast, sharpness, invert, **extra_options
-    )
-    
-    # Resize with aspect ratio correction
-    img = resize_image_with_aspect(img, width, height, char_aspect_ratio)
-    
-    # Apply dithering in monochrome mode
-    if color_mode == 1 and dithering != "none":
-        if dithering not in DITHERING_ALGORITHMS:
-            available = ", ".join(DITHERING_ALGORITHMS.keys())
-            raise ValueError(f"Invalid dithering algorithm. Available: {available}")
-        img = DITHERING_ALGORITHMS[dithering].apply(img)
+    if (style == "minimal" or (style == "detailed" and sharpness == 1.0)) and img.mode in ("L", "RGB"):
+        # Pointwise level adjustments only: shrink first, then adjust the small
+        # image. Sharpening is a convolution, so it must see the source pixels
+        img = resize_image_with_aspect(img, width, height, char_aspect_ratio)
+        img = adjust_levels(img, style, brightness, contrast, sharpness, invert)
+    else:
+        # Apply preprocessing based on style
+        img = preprocess_image(
+            img, style, brightness, contrast, sharpness, invert, **extra_options
+        )
+        
+        # Resize with aspect ratio correction
+        img = resize_image_with_aspect(img, width, height, char_aspect_ratio)
     
     # Create renderer with character set
     renderer = AsciiRenderer(
@@ -1591,6 +2496,17 @@ def convert(
         invert_mapping=False  # Already handled by preprocess_image
     )
     
+    # Apply dithering in monochrome mode
+    if color_mode == 1 and dithering != "none":
+        if dithering not in DITHERING_ALGORITHMS:
+            available = ", ".join(DITHERING_ALGORITHMS.keys())
+            raise ValueError(f"Invalid dithering algorithm. Available: {available}")
+        if HAS_NUMPY:
+            # Stay on arrays from dithering through character mapping
+            lines = renderer.render_gray(dither_array(dithering, np.asarray(img.convert('L'))))
+            return "\n".join(lines)
+        img = DITHERING_ALGORITHMS[dithering].apply(img)
+    
     # Render image to ASCII lines
     lines = renderer.render_image(img, color_mode, bg_color)
     
@@ -1598,10 +2514,54 @@ def convert(
     return "\n".join(lines)
 
 
+# Longest side of the thumbnail that edge density is measured on
+EDGE_SAMPLE_SIZE = 128
+
+# Images below this many pixels (icons, avatars) skip edge analysis
+EDGE_ANALYSIS_MIN_PIXELS = 4096
+
+
+def _edge_density(image: 'Image.Image') -> float:
+    """Measure the mean FIND_EDGES response of an image, from 0.0 to 1.0.
+    
+    The image is box-reduced to at most ``EDGE_SAMPLE_SIZE`` pixels per side first.
+    Output is rarely wider than that in characters, so the sample sees roughly the
+    detail the art can show, and the 3x3 filter runs over a fixed, small image.
+    """
+    if image.mode not in ("L", "RGB", "RGBA"):
+        image = image.convert("L")
+    width, height = image.size
+    scale = EDGE_SAMPLE_SIZE / max(width, height)
+    if scale < 1:
+        image = image.resize((max(1, round(width * scale)), max(1, round(height * scale))), Image.BOX)
+    
+    edge_img = image.convert("L").filter(ImageFilter.FIND_EDGES)
+    if HAS_NUMPY:
+        return float(np.asarray(edge_img, dtype=np.uint8).mean()) / 255
+    return ImageStat.Stat(edge_img).mean[0] / 255
+
+
 # ╭──────────────────────────────────────────────────────╮
 # │  🔌 Integration Point - Public Interface             │
 # ╰──────────────────────────────────────────────────────╯
 
+@lru_cache(maxsize=4)
+def _default_params(terminal_width: int, color_depth: int) -> Dict[str, Any]:
+    """Build ``transform_image``'s terminal-derived defaults; callers copy before editing."""
+    return {
+        # Size parameters - leave margin on terminal width
+        'width': min(terminal_width - 2, 120),
+        
+        # Visual parameters - select based on terminal capabilities
+        'character_set': 'blocks' if color_depth >= 8 else 'standard',
+        'color_mode': color_depth,
+        'style': 'detailed',
+        
+        # Use dithering in monochrome mode
+        'dithering': 'floyd-steinberg' if color_depth == 1 else 'none',
+    }
+
+
 def transform_image(
     source: ImageSource,
     **options
@@ -1618,37 +2578,25 @@ def transform_image(
         ASCII/Unicode art as a string
     """
     # Auto-detect terminal capabilities
-    terminal_width, terminal_height = get_terminal_size()
+    terminal_width, _ = get_terminal_size()
     color_depth = detect_color_support()
     
-    # Load image to analyze content (if not already a PIL Image)
-    img = None
-    if not isinstance(source, (str, Path, bytes)):
-        # Already a PIL Image
-        img = source
+    # Decode once: the same image is analyzed below and handed on to convert
+    img = load_image(source)
     
     # Determine optimal parameters based on image and environment
-    params = {
-        # Size parameters - leave margin on terminal width
-        'width': min(terminal_width - 2, 120),
-        
-        # Visual parameters - select based on terminal capabilities
-        'character_set': 'blocks' if color_depth >= 8 else 'standard',
-        'color_mode': color_depth,
-        'style': 'detailed',
-        
-        # Use dithering in monochrome mode
-        'dithering': 'floyd-steinberg' if color_depth == 1 else 'none',
-    }
-    
-    # Analyze image content if available to make better choices
-    if img and HAS_PIL:
+    params = _default_params(terminal_width, color_depth).copy()
+    
+    # Analyze image content if available to make better choices. The analysis only
+    # picks a character set (its brightness strategy is convert's default anyway),
+    # so it is skipped when the caller already chose one. Icons and bilevel images
+    # keep the defaults without being measured
+    if (img and HAS_PIL and 'character_set' not in options
+            and img.width * img.height >= EDGE_ANALYSIS_MIN_PIXELS and img.mode != '1'):
         # For photos with lots of detail, use more detailed character sets
         try:
             # Measure image complexity (edge density)
-            from PIL import ImageFilter
-            edge_img = img.convert("L").filter(ImageFilter.FIND_EDGES)
-            edge_density = sum(edge_img.getdata()) / (255 * img.width * img.height)
+            edge_density = _edge_density(img)
             
             # For detailed images, use more refined character set
             if edge_density > 0.1:  # Moderate detail
@@ -1667,7 +2615,33 @@ def transform_image(
     params.update(options)
     
     # Execute conversion with optimized parameters
-    return convert(source, **params)
+    return convert(img, **params)
+
+
+# File buffer bounds for AsciiArtBuilder.save
+SAVE_BUFFER_MIN = 1 << 16
+SAVE_BUFFER_MAX = 1 << 20
+
+# Finished renders of file and byte sources, least recently used first
+RENDER_CACHE_SIZE = 32
+_render_cache: 'OrderedDict[Tuple, str]' = OrderedDict()
+
+
+def _source_key(source: ImageSource) -> Optional[Tuple]:
+    """Identify a file or byte source by its content, or None if it can't be cached.
+    
+    Files are keyed by path, modification time and size so they aren't re-read;
+    bytes by a BLAKE2 digest. PIL Images can change in place and are never cached.
+    """
+    if isinstance(source, (str, Path)):
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        return ('path', os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+    if isinstance(source, bytes):
+        return ('bytes', hashlib.blake2b(source, digest_size=16).digest())
+    return None
 
 
 class AsciiArtBuilder:
@@ -1685,6 +2659,9 @@ class AsciiArtBuilder:
                 .render()
     """
     
+    # Builders are often created per frame; slots drop the per-instance __dict__
+    __slots__ = ('source', 'options', 'result')
+    
     def __init__(self, source: Optional[ImageSource] = None):
         """Initialize the builder with optional image source.
         
@@ -1695,6 +2672,16 @@ class AsciiArtBuilder:
         self.options = {}
         self.result = None
     
+    def _set(self, **options: Any) -> 'AsciiArtBuilder':
+        """Store options and drop any render made with the previous ones.
+        
+        Returns:
+            Self for chaining
+        """
+        self.options.update(options)
+        self.result = None
+        return self
+    
     def from_source(self, source: ImageSource) -> 'AsciiArtBuilder':
         """Set the image source.
         
@@ -1705,6 +2692,7 @@ class AsciiArtBuilder:
             Self for chaining
         """
         self.source = source
+        self.result = None
         return self
     
     def width(self, width: int) -> 'AsciiArtBuilder':
@@ -1716,8 +2704,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['width'] = width
-        return self
+        return self._set(width=width)
     
     def height(self, height: int) -> 'AsciiArtBuilder':
         """Set the output height in characters.
@@ -1728,8 +2715,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['height'] = height
-        return self
+        return self._set(height=height)
     
     def style(self, style: str) -> 'AsciiArtBuilder':
         """Set the art style.
@@ -1740,8 +2726,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['style'] = style
-        return self
+        return self._set(style=style)
     
     def character_set(self, char_set: str) -> 'AsciiArtBuilder':
         """Set the character set.
@@ -1752,8 +2737,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['character_set'] = char_set
-        return self
+        return self._set(character_set=char_set)
     
     def custom_chars(self, chars: str) -> 'AsciiArtBuilder':
         """Set custom character sequence.
@@ -1764,9 +2748,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['character_set'] = 'custom'
-        self.options['custom_chars'] = chars
-        return self
+        return self._set(character_set='custom', custom_chars=chars)
     
     def color(self, mode: int = -1) -> 'AsciiArtBuilder':
         """Enable color output with optional mode specification.
@@ -1777,12 +2759,8 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        if mode < 0:
-            # Auto-detect
-            self.options['color_mode'] = detect_color_support()
-        else:
-            self.options['color_mode'] = mode
-        return self
+        # Negative modes auto-detect
+        return self._set(color_mode=detect_color_support() if mode < 0 else mode)
     
     def monochrome(self, dither: str = "floyd-steinberg") -> 'AsciiArtBuilder':
         """Set monochrome mode with dithering.
@@ -1793,9 +2771,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['color_mode'] = 1
-        self.options['dithering'] = dither
-        return self
+        return self._set(color_mode=1, dithering=dither)
     
     def brightness(self, value: float) -> 'AsciiArtBuilder':
         """Set brightness adjustment.
@@ -1806,8 +2782,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['brightness'] = value
-        return self
+        return self._set(brightness=value)
     
     def contrast(self, value: float) -> 'AsciiArtBuilder':
         """Set contrast adjustment.
@@ -1818,8 +2793,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['contrast'] = value
-        return self
+        return self._set(contrast=value)
     
     def invert(self, value: bool = True) -> 'AsciiArtBuilder':
         """Set image inversion.
@@ -1830,8 +2804,7 @@ class AsciiArtBuilder:
         Returns:
             Self for chaining
         """
-        self.options['invert'] = value
-        return self
+        return self._set(invert=value)
     
     def render(self) -> str:
         """Render the ASCII art with current configuration.
@@ -1845,9 +2818,37 @@ class AsciiArtBuilder:
         if self.source is None:
             raise ValueError("No image source specified")
         
+        key = self._cache_key()
+        cached = _render_cache.get(key) if key is not None else None
+        if cached is not None:
+            _render_cache.move_to_end(key)
+            self.result = cached
+            return cached
+        
         self.result = transform_image(self.source, **self.options)
+        if key is not None:
+            _render_cache[key] = self.result
+            if len(_render_cache) > RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
         return self.result
     
+    def _cache_key(self) -> Optional[Tuple]:
+        """Key a render by source content, options and the detected terminal.
+        
+        ``transform_image`` fills unset options from the terminal size and color
+        support, so those are part of the key. Returns None when the source or an
+        option value can't be hashed.
+        """
+        source_key = _source_key(self.source)
+        if source_key is None:
+            return None
+        key = (source_key, frozenset(self.options.items()), get_terminal_size(), detect_color_support())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def save(self, path: Union[str, Path]) -> 'AsciiArtBuilder':
         """Save the rendered ASCII art to a file.
         
@@ -1865,7 +2866,9 @@ class AsciiArtBuilder:
         if self.result is None:
             self.render()
         
-        with open(path, 'w', encoding='utf-8') as f:
+        # Size the buffer to the payload (capped) so large color dumps go out in few writes
+        buffering = min(max(len(self.result), SAVE_BUFFER_MIN), SAVE_BUFFER_MAX)
+        with open(path, 'w', encoding='utf-8', buffering=buffering) as f:
             f.write(self.result)
         
         return self
@@ -1884,7 +2887,10 @@ class AsciiArtBuilder:
         if self.result is None:
             self.render()
         
-        print(self.result)
+        # One write of the whole payload instead of print()'s separate newline write
+        out = sys.stdout
+        out.write(self.result if self.result.endswith('\n') else self.result + '\n')
+        out.flush()
         return self
 
 # Create shorthand function for fluent API
@@ -40,6 +40,34 @@ from enum import Enum
 from typing import List, Dict, Callable, Union, Optional, Tuple, Any
 from functools import lru_cache, wraps
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Texts at least this long interpolate gradient colors with NumPy
+GRADIENT_ARRAY_MIN_LENGTH = 64
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _gradient_channels(n, sr, sg, sb, dr, dg, db):
+        # Same float expressions as Color.gradient's loop, so truncation matches int()
+        r = np.empty(n, np.int64)
+        g = np.empty(n, np.int64)
+        b = np.empty(n, np.int64)
+        for i in range(n):
+            r[i] = int(sr + dr * i / n)
+            g[i] = int(sg + dg * i / n)
+            b[i] = int(sb + db * i / n)
+        return r, g, b
+
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 # ┃ 🌈 Terminal Color System - Precise yet Universal  ┃
 # ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
@@ -73,13 +101,13 @@ class Color:
     REVERSE = "\033[7m"
 
     @staticmethod
-    @lru_cache(maxsize=32)
+    @lru_cache(maxsize=4096)
     def rgb(r: int, g: int, b: int) -> str:
         """Get RGB color code - cached for performance."""
         return f"\033[38;2;{r};{g};{b}m"
 
     @staticmethod
-    @lru_cache(maxsize=32)
+    @lru_cache(maxsize=4096)
     def bg_rgb(r: int, g: int, b: int) -> str:
         """Get RGB background color code - cached for performance."""
         return f"\033[48;2;{r};{g};{b}m"
@@ -87,14 +115,17 @@ class Color:
     @staticmethod
     def rainbow(text: str) -> str:
         """🌈 Apply rainbow coloring to text."""
-        colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA]
-        result = ""
+        colors = (Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA)
+        n = len(colors)
+        reset = Color.RESET
+        parts = []
+        append = parts.append
         for i, char in enumerate(text):
             if char.strip():  # Only color non-whitespace
-                result += f"{colors[i % len(colors)]}{char}{Color.RESET}"
+                append(f"{colors[i % n]}{char}{reset}")
             else:
-                result += char
-        return result
+                append(char)
+        return "".join(parts)
 
     @staticmethod
     def gradient(text: str, start_color: Tuple[int, int, int], end_color: Tuple[int, int, int]) -> str:
@@ -102,25 +133,42 @@ class Color:
         if not text:
             return ""
         
-        result = ""
+        sr, sg, sb = start_color
+        dr, dg, db = end_color[0] - sr, end_color[1] - sg, end_color[2] - sb
+        n = len(text)
+        reset = Color.RESET
+        parts = []
+        append = parts.append
+        if HAS_NUMPY and n >= GRADIENT_ARRAY_MIN_LENGTH:
+            if HAS_NUMBA:
+                channels = [c.tolist() for c in _gradient_channels(n, sr, sg, sb, dr, dg, db)]
+            else:
+                # Same expressions evaluated for every position at once; astype truncates like int()
+                idx = np.arange(n)
+                channels = [(start + delta * idx / n).astype(np.int64).tolist()
+                            for start, delta in ((sr, dr), (sg, dg), (sb, db))]
+            for char, r, g, b in zip(text, *channels):
+                append(f"{Color.rgb(r, g, b)}{char}{reset}" if char.strip() else char)
+            return "".join(parts)
+        
         for i, char in enumerate(text):
             if char.strip():  # Only color non-whitespace
                 # Calculate color at this position
-                r = int(start_color[0] + (end_color[0] - start_color[0]) * i / len(text))
-                g = int(start_color[1] + (end_color[1] - start_color[1]) * i / len(text))
-                b = int(start_color[2] + (end_color[2] - start_color[2]) * i / len(text))
-                result += f"{Color.rgb(r, g, b)}{char}{Color.RESET}"
+                r = int(sr + dr * i / n)
+                g = int(sg + dg * i / n)
+                b = int(sb + db * i / n)
+                append(f"{Color.rgb(r, g, b)}{char}{reset}")
             else:
-                result += char
-        return result
+                append(char)
+        return "".join(parts)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def supports_color() -> bool:
-        """Check if the terminal supports color."""
-        return (
+        """Check if the terminal supports color - detected once per process."""
+        return bool(
             hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and
-            'COLORTERM' in os.environ or 'TERM' in os.environ and 
-            os.environ.get('TERM') != 'dumb'
+            ('COLORTERM' in os.environ or os.environ.get('TERM', 'dumb') != 'dumb')
         )
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
@@ -164,14 +212,17 @@ class BorderStyle:
         'tl': '✧', 'tr': '✧', 'bl': '✧', 'br': '✧',
         'h': '✦', 'v': '✧'
     }
+    
+    # Lowercase name lookup built once, so get_style is a single dict get
+    _STYLES = {
+        'ascii': ASCII, 'single': SINGLE, 'double': DOUBLE, 'rounded': ROUNDED,
+        'bold': BOLD, 'diamond': DIAMOND, 'stars': STARS
+    }
 
     @classmethod
     def get_style(cls, name: str) -> Dict[str, str]:
         """Get border style by name or return ASCII if not found."""
-        try:
-            return getattr(cls, name.upper())
-        except AttributeError:
-            return cls.ASCII
+        return cls._STYLES.get(name.lower(), cls.ASCII)
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 # ┃ 🔧 Utility Functions - Small but Mighty Helpers  ┃
@@ -184,18 +235,59 @@ def get_terminal_size() -> Tuple[int, int]:
     except (AttributeError, OSError):
         return (80, 24)  # Sensible fallback
 
+# DEC private mode 2026 (synchronized output): the terminal holds repaints between
+# these markers and shows the frame at once; terminals without support ignore them
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
+
+def write_frame(text: str) -> None:
+    """Write text to stdout in one call, as a synchronized update on terminals."""
+    out = sys.stdout
+    if hasattr(out, 'isatty') and out.isatty():
+        text = f"{_SYNC_BEGIN}{text}{_SYNC_END}"
+    out.write(text)
+
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+@lru_cache(maxsize=1024)
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape sequences from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    if '\x1b' not in text:  # Plain text needs no regex pass
+        return text
+    return _ANSI_RE.sub('', text)
 
+@lru_cache(maxsize=1024)
 def text_length(text: str) -> int:
     """Get actual display length of text by stripping ANSI sequences."""
     return len(strip_ansi(text))
 
-def center_text(text: str, width: int) -> str:
-    """Center text considering actual display width."""
-    text_width = text_length(text)
+def color_wrapper(color: Optional[str]) -> Callable[[str], str]:
+    """Get a function that wraps text in ``color`` and a reset, or ``str`` if no color."""
+    if not color:
+        return str
+    return lambda text, c=color, reset=Color.RESET: f"{c}{text}{reset}"
+
+def styled_cells(text: str) -> List[str]:
+    """Split text into one self-contained string per visible character.
+    
+    Each cell repeats the escape sequences in effect at its position and ends
+    with a reset, so cells can be drawn anywhere on screen in any order.
+    """
+    cells = []
+    style = ""
+    pos = 0
+    for match in _ANSI_RE.finditer(text):
+        cells.extend(f"{style}{char}{Color.RESET}" if style else char for char in text[pos:match.start()])
+        sequence = match.group()
+        style = "" if sequence in (Color.RESET, "\x1b[m") else style + sequence
+        pos = match.end()
+    cells.extend(f"{style}{char}{Color.RESET}" if style else char for char in text[pos:])
+    return cells
+
+def center_text(text: str, width: int, text_width: Optional[int] = None) -> str:
+    """Center text considering actual display width (pass it if already known)."""
+    if text_width is None:
+        text_width = text_length(text)
     if text_width >= width:
         return text
     padding = (width - text_width) // 2
@@ -206,26 +298,29 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if text_length(text) <= max_length:
         return text
     
-    # Find the cutoff point that respects ANSI sequences
-    result = ""
-    current_length = 0
-    i = 0
-    
-    while current_length < max_length - len(suffix) and i < len(text):
-        if text[i] == '\033':  # ANSI escape sequence
-            j = i
-            while j < len(text) and text[j] != 'm':
-                j += 1
-            if j < len(text):
-                result += text[i:j+1]
-                i = j + 1
-                continue
-        
-        result += text[i]
-        current_length += 1
-        i += 1
-    
-    return result + suffix + Color.RESET
+    limit = max_length - len(suffix)
+    if '\x1b' not in text:
+        return text[:max(limit, 0)] + suffix + Color.RESET
+    
+    # Escape sequences pass through untouched until the cut; printable runs are sliced
+    parts = []
+    remaining = limit
+    pos = 0
+    for match in _ANSI_RE.finditer(text):
+        if remaining <= 0:
+            break
+        run = text[pos:match.start()]
+        parts.append(run[:remaining])
+        remaining -= len(run)
+        if remaining <= 0:
+            break
+        parts.append(match.group())
+        pos = match.end()
+    else:
+        if remaining > 0:
+            parts.append(text[pos:pos + remaining])
+    
+    return "".join(parts) + suffix + Color.RESET
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 # ┃ 🎁 Banner Class - Core Implementation            ┃
@@ -237,6 +332,10 @@ class Alignment(Enum):
     CENTER = "center"
     RIGHT = "right"
 
+# Integer codes compared per line in _align_text; the enum stays the public API
+_ALIGN_LEFT, _ALIGN_CENTER, _ALIGN_RIGHT = 0, 1, 2
+_ALIGN_CODES = {Alignment.LEFT: _ALIGN_LEFT, Alignment.CENTER: _ALIGN_CENTER, Alignment.RIGHT: _ALIGN_RIGHT}
+
 class Banner:
     """
     Modular banner generator with styling and layout options.
@@ -253,6 +352,17 @@ class Banner:
         self.title_color = None
         self.content_color = None
         self.alignment = Alignment.LEFT
+        self._skeleton = None  # (key, border pieces) from the last render
+    
+    @property
+    def alignment(self) -> Alignment:
+        """Text alignment of content lines."""
+        return self._alignment
+    
+    @alignment.setter
+    def alignment(self, alignment: Alignment) -> None:
+        self._alignment = alignment
+        self._align_code = _ALIGN_CODES[alignment]
     
     def set_border(self, style_name: str) -> 'Banner':
         """Set border style by name."""
@@ -319,95 +429,121 @@ class Banner:
             return f"{self.content_color}{text}{Color.RESET}"
         return text
     
-    def _align_text(self, text: str, width: int) -> str:
-        """Align text according to the alignment setting."""
-        text_width = text_length(text)
+    def _align_text(self, text: str, width: int, text_width: Optional[int] = None) -> str:
+        """Align text according to the alignment setting.
         
-        if self.alignment == Alignment.CENTER:
-            return center_text(text, width)
-        elif self.alignment == Alignment.RIGHT:
+        Alignment only prepends spaces, so the display width of the result is
+        ``text_width`` plus the growth in length.
+        """
+        if text_width is None:
+            text_width = text_length(text)
+        
+        code = self._align_code
+        if code == _ALIGN_CENTER:
+            return center_text(text, width, text_width)
+        elif code == _ALIGN_RIGHT:
             if text_width >= width:
                 return text
             return " " * (width - text_width) + text
         else:  # LEFT
             return text
     
-    def _format_line(self, line: str) -> str:
-        """Format a content line with proper alignment and width."""
+    def _format_line(self, line: str, v_border: Optional[str] = None,
+                     wrap_content: Optional[Callable[[str], str]] = None) -> str:
+        """Format a content line with proper alignment and width.
+        
+        ``render`` passes its pre-colored vertical border and content wrapper;
+        they are built here otherwise.
+        """
         max_width = self.width - (2 * self.padding + 2)  # Account for borders and padding
-        if text_length(line) > max_width:
+        text_width = text_length(line) if '\x1b' in line else len(line)
+        if text_width > max_width:
             line = truncate_text(line, max_width)
+            text_width = text_length(line)
         
         padding_str = " " * self.padding
         bordered_width = self.width - 2  # Width inside borders
         
-        aligned_text = self._align_text(line, bordered_width - 2 * self.padding)
-        colored_text = self._apply_content_color(aligned_text)
+        aligned_text = self._align_text(line, bordered_width - 2 * self.padding, text_width)
+        aligned_width = text_width + len(aligned_text) - len(line)
+        if wrap_content is None:
+            wrap_content = self._apply_content_color
+        colored_text = wrap_content(aligned_text)
         
-        v_border = self._apply_border_color(self.border_style['v'])
+        if v_border is None:
+            v_border = self._apply_border_color(self.border_style['v'])
         
-        return f"{v_border}{padding_str}{colored_text}{' ' * (bordered_width - text_length(aligned_text) - 2 * self.padding)}{padding_str}{v_border}"
+        return f"{v_border}{padding_str}{colored_text}{' ' * (bordered_width - aligned_width - 2 * self.padding)}{padding_str}{v_border}"
     
-    def render(self) -> str:
-        """Render the banner to a string."""
-        result = []
+    def _border_pieces(self, border_color: Optional[str]) -> Tuple[str, str, str, str]:
+        """Get the colored vertical border, horizontal run, top and bottom borders.
         
-        # Top border
-        top_border = (
-            self._apply_border_color(self.border_style['tl']) + 
-            self._apply_border_color(self.border_style['h'] * (self.width - 2)) + 
-            self._apply_border_color(self.border_style['tr'])
+        Cached on the banner and keyed by everything they are built from.
+        """
+        bs = self.border_style
+        key = (self.width, border_color, bs['tl'], bs['tr'], bs['bl'], bs['br'], bs['h'], bs['v'])
+        cached = self._skeleton
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        color = color_wrapper(border_color)
+        h_run = color(bs['h'] * (self.width - 2))
+        pieces = (
+            color(bs['v']),
+            h_run,
+            color(bs['tl']) + h_run + color(bs['tr']),
+            color(bs['bl']) + h_run + color(bs['br']),
         )
-        result.append(top_border)
+        self._skeleton = (key, pieces)
+        return pieces
+    
+    def render(self, use_color: bool = True) -> str:
+        """Render the banner to a string, leaving out color codes if ``use_color`` is False."""
+        # Every piece goes straight into one list, newlines included, and is joined once
+        parts = []
+        add = parts.extend
+        
+        # Color wrappers are chosen once: identity when unset, else one f-string
+        wrap_content = color_wrapper(self.content_color if use_color else None)
+        
+        # Colored border pieces depend only on width, style and color, so they are
+        # kept between renders and rebuilt only when one of those changes
+        v_border, h_run, top_border, bottom_border = self._border_pieces(self.border_color if use_color else None)
+        
+        # Top border
+        add((top_border, "\n"))
         
         # Title if present
         if self.title:
             title_text = f" {self.title} "
-            if text_length(title_text) > self.width - 4:
+            # Plain titles are measured by len(); only escapes need the ANSI-aware path
+            title_width = text_length(title_text) if '\x1b' in title_text else len(title_text)
+            if title_width > self.width - 4:
                 title_text = truncate_text(title_text, self.width - 4)
+                title_width = text_length(title_text)
             
-            centered_title = center_text(title_text, self.width - 2)
-            title_line = (
-                self._apply_border_color(self.border_style['v']) + 
-                self._apply_title_color(centered_title) + 
-                self._apply_border_color(self.border_style['v'])
-            )
-            result.append(title_line)
+            centered_title = center_text(title_text, self.width - 2, title_width)
+            add((v_border, color_wrapper(self.title_color if use_color else None)(centered_title), v_border, "\n"))
             
             # Separator after title
-            separator = (
-                self._apply_border_color(self.border_style['v']) + 
-                self._apply_border_color(self.border_style['h'] * (self.width - 2)) + 
-                self._apply_border_color(self.border_style['v'])
-            )
-            result.append(separator)
+            add((v_border, h_run, v_border, "\n"))
         
         # Empty line if no content
         if not self.content_lines:
-            empty_line = (
-                self._apply_border_color(self.border_style['v']) + 
-                " " * (self.width - 2) + 
-                self._apply_border_color(self.border_style['v'])
-            )
-            result.append(empty_line)
+            add((v_border, " " * (self.width - 2), v_border, "\n"))
         
         # Content lines
         for line in self.content_lines:
-            result.append(self._format_line(line))
+            add((self._format_line(line, v_border, wrap_content), "\n"))
         
         # Bottom border
-        bottom_border = (
-            self._apply_border_color(self.border_style['bl']) + 
-            self._apply_border_color(self.border_style['h'] * (self.width - 2)) + 
-            self._apply_border_color(self.border_style['br'])
-        )
-        result.append(bottom_border)
+        add((bottom_border,))
         
-        return "\n".join(result)
+        return "".join(parts)
     
     def display(self) -> None:
-        """Display the banner to stdout."""
-        print(self.render())
+        """Display the banner to stdout, without color codes when it is not a color terminal."""
+        write_frame(self.render(Color.supports_color()) + "\n")
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 # ┃ 🎨 Theme System - Consistent Visual Language     ┃
@@ -466,9 +602,11 @@ class Theme:
             raise ValueError(f"Theme '{theme_name}' not found. Available themes: {', '.join(cls.THEMES.keys())}")
             
         theme = cls.THEMES[theme_name]
-        return banner.set_border_color(theme["border"]) \
-                    .set_title_color(theme["title"]) \
-                    .set_content_color(theme["content"])
+        # Plain attribute writes; the fluent setters are for callers, not this hot path
+        banner.border_color = theme["border"]
+        banner.title_color = theme["title"]
+        banner.content_color = theme["content"]
+        return banner
     
     @classmethod
     def register_theme(cls, name: str, border_color: str, title_color: str, content_color: str) -> None:
@@ -497,13 +635,12 @@ class Effect:
         sys.stdout.write(f"\033[{len(lines)}A")
         sys.stdout.flush()
         
-        # Display each character with delay
-        displayed = ["" for _ in range(len(lines))]
-        for i in range(max(len(line) for line in lines)):
-            for j, line in enumerate(lines):
-                if i < len(line):
-                    displayed[j] += line[i]
-                    sys.stdout.write(f"\033[{j+1};1H{displayed[j]}")
+        # Display each character with delay. A tick only draws the newly revealed
+        # cell of each line at its own column, in one batched write
+        cells = [styled_cells(line) for line in lines]
+        for i in range(max(len(row) for row in cells)):
+            frame = [f"\033[{j+1};{i+1}H{row[i]}" for j, row in enumerate(cells) if i < len(row)]
+            write_frame("".join(frame))
             sys.stdout.flush()
             time.sleep(delay)
         print()  # Final newline
@@ -512,18 +649,18 @@ class Effect:
     def blink(banner: Banner, blink_times: int = 3, delay: float = 0.3) -> None:
         """Make the banner blink."""
         full_text = banner.render()
+        lines = full_text.count('\n') + 1
         for _ in range(blink_times * 2):
             # Clear the area
-            lines = full_text.count('\n') + 1
-            print('\n' * lines)
-            sys.stdout.write(f"\033[{lines}A")
+            frame = '\n' * lines + f"\n\033[{lines}A"
             
             # Toggle visibility
             if _ % 2 == 0:
-                print(full_text)
+                frame += full_text + '\n'
             else:
-                print('\n' * (lines - 1))
+                frame += '\n' * (lines - 1) + '\n'
             
+            write_frame(frame)
             sys.stdout.flush()
             time.sleep(delay)
 
@@ -14,12 +14,60 @@ Structured elegance for terminal artistry.
 
 Form and function merge into perfect geometric harmony.
 """
-from typing import Dict, List, Tuple, Optional, Union, Any
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Union, Any, NamedTuple
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 # ┃ Border Style Definitions - Structure as Control  ┃
 # ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
 
+class BorderChars(NamedTuple):
+    """
+    Immutable set of border characters—one tuple slot per component.
+    Attribute access (``style.h``) is a plain tuple index; ``style['h']``
+    still works for code written against the old dict styles.
+    """
+    tl: str
+    tr: str
+    bl: str
+    br: str
+    h: str
+    v: str
+    tj: str
+    bj: str
+    lj: str
+    rj: str
+    x: str
+    
+    def __getitem__(self, key):
+        """Index by component name like a dict, or by position like a tuple."""
+        if key.__class__ is str:
+            try:
+                return tuple.__getitem__(self, _FIELD_INDEX[key])
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+_FIELD_INDEX = {name: i for i, name in enumerate(BorderChars._fields)}
+
+@lru_cache(maxsize=512)
+def _box_cached(style: BorderChars, width: int, height: int) -> Tuple[str, ...]:
+    """
+    Build box rows once per style and geometry—redraws reuse the same strings.
+    """
+    run = style.h * (width - 2)
+    middle = f"{style.v}{' ' * (width-2)}{style.v}"
+    return (f"{style.tl}{run}{style.tr}", *([middle] * (height - 2)), f"{style.bl}{run}{style.br}")
+
+@lru_cache(maxsize=512)
+def _line_cached(char: str, width: int, line_type: str) -> str:
+    """
+    Build a line once per character, length and direction.
+    """
+    if line_type == 'h':  # Horizontal line
+        return char * width
+    return '\n'.join([char] * width)  # Vertical line
+
 class BorderStyle:
     """
     Border style definitions with atomic precision.
@@ -32,72 +80,72 @@ class BorderStyle:
     # lj = left junction, rj = right junction, x = crossing
     
     # Classical styles - timeless elegance
-    ASCII = {
-        'tl': '+', 'tr': '+', 'bl': '+', 'br': '+',
-        'h': '-', 'v': '|',
-        'tj': '+', 'bj': '+', 'lj': '+', 'rj': '+', 'x': '+'
-    }
+    ASCII = BorderChars(
+        tl='+', tr='+', bl='+', br='+',
+        h='-', v='|',
+        tj='+', bj='+', lj='+', rj='+', x='+'
+    )
     
-    SINGLE = {
-        'tl': '┌', 'tr': '┐', 'bl': '└', 'br': '┘',
-        'h': '─', 'v': '│',
-        'tj': '┬', 'bj': '┴', 'lj': '├', 'rj': '┤', 'x': '┼'
-    }
+    SINGLE = BorderChars(
+        tl='┌', tr='┐', bl='└', br='┘',
+        h='─', v='│',
+        tj='┬', bj='┴', lj='├', rj='┤', x='┼'
+    )
     
-    DOUBLE = {
-        'tl': '╔', 'tr': '╗', 'bl': '╚', 'br': '╝',
-        'h': '═', 'v': '║',
-        'tj': '╦', 'bj': '╩', 'lj': '╠', 'rj': '╣', 'x': '╬'
-    }
+    DOUBLE = BorderChars(
+        tl='╔', tr='╗', bl='╚', br='╝',
+        h='═', v='║',
+        tj='╦', bj='╩', lj='╠', rj='╣', x='╬'
+    )
     
-    ROUNDED = {
-        'tl': '╭', 'tr': '╮', 'bl': '╰', 'br': '╯',
-        'h': '─', 'v': '│',
-        'tj': '┬', 'bj': '┴', 'lj': '├', 'rj': '┤', 'x': '┼'
-    }
+    ROUNDED = BorderChars(
+        tl='╭', tr='╮', bl='╰', br='╯',
+        h='─', v='│',
+        tj='┬', bj='┴', lj='├', rj='┤', x='┼'
+    )
     
-    BOLD = {
-        'tl': '┏', 'tr': '┓', 'bl': '┗', 'br': '┛',
-        'h': '━', 'v': '┃',
-        'tj': '┳', 'bj': '┻', 'lj': '┣', 'rj': '┫', 'x': '╋'
-    }
+    BOLD = BorderChars(
+        tl='┏', tr='┓', bl='┗', br='┛',
+        h='━', v='┃',
+        tj='┳', bj='┻', lj='┣', rj='┫', x='╋'
+    )
     
     # Aesthetic styles - artistic expression
-    DIAMOND = {
-        'tl': '◆', 'tr': '◆', 'bl': '◆', 'br': '◆',
-        'h': '◆', 'v': '◆',
-        'tj': '◆', 'bj': '◆', 'lj': '◆', 'rj': '◆', 'x': '◆'
-    }
+    DIAMOND = BorderChars(
+        tl='◆', tr='◆', bl='◆', br='◆',
+        h='◆', v='◆',
+        tj='◆', bj='◆', lj='◆', rj='◆', x='◆'
+    )
     
-    STARS = {
-        'tl': '✧', 'tr': '✧', 'bl': '✧', 'br': '✧',
-        'h': '✦', 'v': '✧',
-        'tj': '✧', 'bj': '✧', 'lj': '✧', 'rj': '✧', 'x': '✧'
-    }
+    STARS = BorderChars(
+        tl='✧', tr='✧', bl='✧', br='✧',
+        h='✦', v='✧',
+        tj='✧', bj='✧', lj='✧', rj='✧', x='✧'
+    )
     
-    BLOCKS = {
-        'tl': '█', 'tr': '█', 'bl': '█', 'br': '█',
-        'h': '█', 'v': '█',
-        'tj': '█', 'bj': '█', 'lj': '█', 'rj': '█', 'x': '█'
-    }
+    BLOCKS = BorderChars(
+        tl='█', tr='█', bl='█', br='█',
+        h='█', v='█',
+        tj='█', bj='█', lj='█', rj='█', x='█'
+    )
     
-    DOTS = {
-        'tl': '•', 'tr': '•', 'bl': '•', 'br': '•',
-        'h': '·', 'v': '•',
-        'tj': '•', 'bj': '•', 'lj': '•', 'rj': '•', 'x': '•'
-    }
+    DOTS = BorderChars(
+        tl='•', tr='•', bl='•', br='•',
+        h='·', v='•',
+        tj='•', bj='•', lj='•', rj='•', x='•'
+    )
     
-    SHADOW = {
-        'tl': '▓', 'tr': '▓', 'bl': '░', 'br': '░',
-        'h': '▓', 'v': '▓',
-        'tj': '▓', 'bj': '░', 'lj': '▓', 'rj': '▓', 'x': '▓'
-    }
+    SHADOW = BorderChars(
+        tl='▓', tr='▓', bl='░', br='░',
+        h='▓', v='▓',
+        tj='▓', bj='░', lj='▓', rj='▓', x='▓'
+    )
 
     # System registry - dynamic style management
     _style_registry = {}
 
     @classmethod
-    def get_style(cls, name: str) -> Dict[str, str]:
+    def get_style(cls, name: str) -> BorderChars:
         """
         Retrieve border style by name with quantum reliability.
         If the style exists in any dimension, you'll get it.
@@ -113,6 +161,23 @@ class BorderStyle:
             print(f"Style '{name}' not found in this dimension—using ASCII fallback! 🌌")
             return cls.ASCII
 
+    @classmethod
+    def _to_chars(cls, style_dict: Dict[str, str]) -> BorderChars:
+        """
+        Crystallize a style dict into BorderChars.
+        Missing junctions are derived from the corners and edges.
+        """
+        # Add missing junction characters with intelligent defaults
+        get = style_dict.get
+        return BorderChars(
+            tl=style_dict['tl'], tr=style_dict['tr'],
+            bl=style_dict['bl'], br=style_dict['br'],
+            h=style_dict['h'], v=style_dict['v'],
+            tj=get('tj', style_dict['h']), bj=get('bj', style_dict['h']),
+            lj=get('lj', style_dict['v']), rj=get('rj', style_dict['v']),
+            x=get('x', style_dict['tl'])
+        )
+    
     @classmethod
     def register_style(cls, name: str, style_dict: Dict[str, str]) -> None:
         """
@@ -126,18 +191,8 @@ class BorderStyle:
             missing = required_keys - set(style_dict.keys())
             raise ValueError(f"Incomplete border style! Missing components: {missing}. Even art needs structure! 🎭")
             
-        # Register with automatic junction creation if missing
-        full_style = style_dict.copy()
-        
-        # Add missing junction characters with intelligent defaults
-        if 'tj' not in full_style: full_style['tj'] = style_dict['h']
-        if 'bj' not in full_style: full_style['bj'] = style_dict['h']
-        if 'lj' not in full_style: full_style['lj'] = style_dict['v']
-        if 'rj' not in full_style: full_style['rj'] = style_dict['v']
-        if 'x' not in full_style: full_style['x'] = style_dict['tl']
-            
         # Commit to the style registry—permanent geometric reality
-        cls._style_registry[name.lower()] = full_style
+        cls._style_registry[name.lower()] = cls._to_chars(style_dict)
         print(f"Style '{name}' has materialized in the universe of borders! ✨")
 
     @classmethod
@@ -149,46 +204,36 @@ class BorderStyle:
         # Get built-in styles through reflection
         builtin_styles = [attr for attr in dir(cls) if 
                          attr.isupper() and 
-                         isinstance(getattr(cls, attr), dict)]
+                         isinstance(getattr(cls, attr), BorderChars)]
         
         # Combine with registered styles for complete dimensional mapping
         all_styles = builtin_styles + list(cls._style_registry.keys())
         return sorted(all_styles)
 
     @classmethod
-    def create_line(cls, style: Dict[str, str], width: int, line_type: str = 'h') -> str:
+    def create_line(cls, style: Union[BorderChars, Dict[str, str]], width: int, line_type: str = 'h') -> str:
         """
         Create a horizontal or vertical line with specified style.
         Mathematical precision in one dimension.
         """
-        if line_type == 'h':  # Horizontal line
-            return style['h'] * width
-        elif line_type == 'v':  # Vertical line
-            return '\n'.join([style['v']] * width)
-        else:
+        if line_type != 'h' and line_type != 'v':
             raise ValueError(f"Line type '{line_type}' does not exist in this dimension! Choose 'h' or 'v'. 📏")
+        # A line needs only its own component, so partial style dicts still work
+        return _line_cached(style[line_type], width, line_type)
 
     @classmethod
-    def create_box(cls, style: Dict[str, str], width: int, height: int) -> List[str]:
+    def create_box(cls, style: Union[BorderChars, Dict[str, str]], width: int, height: int) -> List[str]:
         """
         Create a complete box with specified style, width, and height.
         Perfect geometry manifested in terminal space.
         """
         if width < 2 or height < 2:
             raise ValueError("Box must be at least 2x2 in size. Even quarks have minimum dimensions! 🔬")
+        if not isinstance(style, BorderChars):
+            style = cls._to_chars(style)
             
-        box = []
-        # Top border
-        box.append(f"{style['tl']}{style['h'] * (width-2)}{style['tr']}")
-        
-        # Middle lines
-        for _ in range(height - 2):
-            box.append(f"{style['v']}{' ' * (width-2)}{style['v']}")
-            
-        # Bottom border
-        box.append(f"{style['bl']}{style['h'] * (width-2)}{style['br']}")
-        
-        return box
+        # Rows come from the cache; a fresh list keeps callers free to modify it
+        return list(_box_cached(style, width, height))
 
 # Self-testing capability—geometric self-awareness
 if __name__ == "__main__":
@@ -21,6 +21,35 @@ import re
 from typing import Tuple, Dict, Union, Optional
 from functools import lru_cache
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Long texts interpolate gradients as arrays—per-character math stays for short ones
+GRADIENT_ARRAY_MIN_LENGTH = 64
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _gradient_channels(n, steps, sr, sg, sb, dr, dg, db):
+        # Compiled twin of Color.gradient's interpolation—identical float steps, identical ints
+        r = np.empty(n, np.int64)
+        g = np.empty(n, np.int64)
+        b = np.empty(n, np.int64)
+        for i in range(n):
+            progress = i / steps
+            r[i] = int(sr + dr * progress)
+            g[i] = int(sg + dg * progress)
+            b[i] = int(sb + db * progress)
+        return r, g, b
+
 class Color:
     """
     Terminal color system with automatic capability detection and optimization.
@@ -76,7 +105,7 @@ class Color:
     }
 
     @staticmethod
-    @lru_cache(maxsize=32)
+    @lru_cache(maxsize=4096)
     def rgb(r: int, g: int, b: int) -> str:
         """
         Generate RGB color code with memoization for quantum-computing-level efficiency.
@@ -88,7 +117,7 @@ class Color:
         return f"\033[38;2;{r};{g};{b}m"
 
     @staticmethod
-    @lru_cache(maxsize=32)
+    @lru_cache(maxsize=4096)
     def bg_rgb(r: int, g: int, b: int) -> str:
         """
         Generate RGB background color with ultimate performance optimization.
@@ -107,14 +136,17 @@ class Color:
         if not text:
             return ""  # Empty string? Empty rainbow. Conservation of energy.
             
-        colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA]
-        result = ""
+        colors = (Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA)
+        n = len(colors)
+        reset = Color.RESET
+        parts = []  # Joined once at the end—no quadratic string growth
+        append = parts.append
         for i, char in enumerate(text):
             if char.strip():  # Color only visible matter, not spaces
-                result += f"{colors[i % len(colors)]}{char}{Color.RESET}"
+                append(f"{colors[i % n]}{char}{reset}")
             else:
-                result += char
-        return result
+                append(char)
+        return "".join(parts)
 
     @staticmethod
     def gradient(text: str, start_color: Tuple[int, int, int], end_color: Tuple[int, int, int]) -> str:
@@ -125,18 +157,35 @@ class Color:
         if not text:
             return ""
         
-        result = ""
+        sr, sg, sb = start_color
+        dr, dg, db = end_color[0] - sr, end_color[1] - sg, end_color[2] - sb
+        steps = max(len(text)-1, 1)  # Avoid division by zero—universe intact
+        reset = Color.RESET
+        parts = []
+        append = parts.append
+        if HAS_NUMPY and len(text) >= GRADIENT_ARRAY_MIN_LENGTH:
+            if HAS_NUMBA:
+                channels = [c.tolist() for c in _gradient_channels(len(text), steps, sr, sg, sb, dr, dg, db)]
+            else:
+                # Every position interpolated in one vector pass; astype truncates like int()
+                progress = np.arange(len(text)) / steps
+                channels = [(start + delta * progress).astype(np.int64).tolist()
+                            for start, delta in ((sr, dr), (sg, dg), (sb, db))]
+            for char, r, g, b in zip(text, *channels):
+                append(f"{Color.rgb(r, g, b)}{char}{reset}" if char.strip() else char)
+            return "".join(parts)
+        
         for i, char in enumerate(text):
             if char.strip():  # Empty space carries no color
                 # Linear interpolation with single-pass efficiency
-                progress = i / max(len(text)-1, 1)  # Avoid division by zero—universe intact
-                r = int(start_color[0] + (end_color[0] - start_color[0]) * progress)
-                g = int(start_color[1] + (end_color[1] - start_color[1]) * progress)
-                b = int(start_color[2] + (end_color[2] - start_color[2]) * progress)
-                result += f"{Color.rgb(r, g, b)}{char}{Color.RESET}"
+                progress = i / steps
+                r = int(sr + dr * progress)
+                g = int(sg + dg * progress)
+                b = int(sb + db * progress)
+                append(f"{Color.rgb(r, g, b)}{char}{reset}")
             else:
-                result += char
-        return result
+                append(char)
+        return "".join(parts)
     
     @staticmethod
     def blend_colors(color1: str, color2: str, ratio: float = 0.5) -> str:
@@ -163,12 +212,14 @@ class Color:
         return Color.rgb(r, g, b)
         
     @staticmethod
+    @lru_cache(maxsize=1)
     def supports_color() -> bool:
         """
         Detect terminal's color capability with quantum certainty.
         Your terminal either supports color or it doesn't—no superposition allowed.
+        Observed once per process; the answer doesn't change while we run.
         """
-        return (
+        return bool(
             hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and
             ('COLORTERM' in os.environ or 
              ('TERM' in os.environ and os.environ.get('TERM') != 'dumb'))
@@ -18,6 +18,7 @@ Zero waste. Maximum impact. Pure utility.
 import re
 import shutil
 import time
+from functools import lru_cache
 from typing import Tuple, List, Dict, Any, Callable, Optional
 
 # ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
@@ -34,14 +35,19 @@ def get_terminal_size() -> Tuple[int, int]:
     except (AttributeError, OSError):
         return (80, 24)  # Universal constants in the terminal multiverse
 
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+@lru_cache(maxsize=1024)
 def strip_ansi(text: str) -> str:
     """
     Remove ANSI escape sequences with regex precision.
     Like a quantum filter that removes color without disturbing content.
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    if '\x1b' not in text:  # Nothing to filter—skip the regex entirely
+        return text
+    return _ANSI_RE.sub('', text)
 
+@lru_cache(maxsize=1024)
 def text_length(text: str) -> int:
     """
     Calculate visual length of text, ignoring invisible ANSI codes.
@@ -78,27 +84,30 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if text_length(text) <= max_length:
         return text
     
-    # Find cutoff point that respects ANSI sequences—dimensional awareness
-    result = ""
-    current_length = 0
-    i = 0
+    limit = max_length - len(suffix)
+    if '\x1b' not in text:
+        return text[:max(limit, 0)] + suffix + '\033[0m'
     
-    while current_length < max_length - len(suffix) and i < len(text):
-        if text[i] == '\033':  # ANSI escape sequence detected
-            j = i
-            while j < len(text) and text[j] != 'm':
-                j += 1
-            if j < len(text):
-                result += text[i:j+1]
-                i = j + 1
-                continue
-        
-        result += text[i]
-        current_length += 1
-        i += 1
+    # One regex pass splits escapes from printable runs—escapes survive until the cut
+    parts = []
+    remaining = limit
+    pos = 0
+    for match in _ANSI_RE.finditer(text):
+        if remaining <= 0:
+            break
+        run = text[pos:match.start()]
+        parts.append(run[:remaining])
+        remaining -= len(run)
+        if remaining <= 0:
+            break
+        parts.append(match.group())
+        pos = match.end()
+    else:
+        if remaining > 0:
+            parts.append(text[pos:pos + remaining])
     
     # Add suffix and reset any unclosed color codes
-    return result + suffix + '\033[0m'
+    return "".join(parts) + suffix + '\033[0m'
 
 def measure_execution_time(func: Callable) -> Callable:
     """
@@ -10,3 +10,66 @@ This module should embody core Terminal Forge architectural patterns while maint
 crystal-clear intent and optimal performance characteristics.
 """
 
+
+import random
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image
+
+import terminal_forge.ascii_art as ascii_art
+from terminal_forge.ascii_art import (
+    Atkinson, ColorDithering, ColorSystem, FloydSteinberg,
+    JarvisJudiceNinke, Sierra, StuckiDithering,
+)
+
+# (width, height): single row, single column, and an odd-sized block
+SIZES = [(23, 1), (1, 23), (13, 17)]
+GRAY_ALGORITHMS = [FloydSteinberg, Atkinson, JarvisJudiceNinke, Sierra, StuckiDithering]
+
+BACKENDS = [
+    pytest.param("numpy", marks=pytest.mark.skipif(not ascii_art.HAS_NUMPY, reason="NumPy not installed")),
+    pytest.param("numba", marks=pytest.mark.skipif(not ascii_art.HAS_NUMBA, reason="Numba not installed")),
+]
+
+
+def _noise(mode, size, seed):
+    """Deterministic noise image, built without NumPy so every backend sees the same input."""
+    width, height = size
+    data = random.Random(seed).randbytes(width * height * len(mode))
+    return Image.frombytes(mode, size, data)
+
+
+def _use_backend(monkeypatch, backend):
+    """Force the kernels chosen at call time to the scalar, NumPy or Numba path."""
+    monkeypatch.setattr(ascii_art, "HAS_NUMPY", backend != "python")
+    monkeypatch.setattr(ascii_art, "HAS_NUMBA", backend == "numba")
+    # Each backend fills its own ANSI lookup cube, lazily or in bulk
+    monkeypatch.setattr(ColorSystem, "_ANSI_LUTS", {})
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("algorithm", GRAY_ALGORITHMS, ids=lambda a: a.name)
+def test_gray_dithering_backends_agree(monkeypatch, algorithm, size, backend):
+    image = _noise("L", size, seed=size[0] * 31 + size[1])
+    
+    _use_backend(monkeypatch, "python")
+    expected = algorithm.apply(image).tobytes()
+    
+    _use_backend(monkeypatch, backend)
+    assert algorithm.apply(image).tobytes() == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("palette_size", [8, 16, 256])
+def test_perceptual_color_dithering_backends_agree(monkeypatch, palette_size, size, backend):
+    image = _noise("RGB", size, seed=size[0] * 31 + size[1])
+    
+    _use_backend(monkeypatch, "python")
+    expected = ColorDithering.floyd_steinberg(image, palette_size, perceptual=True).tobytes()
+    
+    _use_backend(monkeypatch, backend)
+    assert ColorDithering.floyd_steinberg(image, palette_size, perceptual=True).tobytes() == expected